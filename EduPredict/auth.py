@@ -1,68 +1,73 @@
 from django.shortcuts import render, redirect
+from django.urls import reverse
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
-from django.core.files.storage import FileSystemStorage
-from django.http import HttpResponse
-from educationmodel.models import Signup, Feedback
-
-import pandas as pd
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.functions import Concat, Upper
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
+from django.http import FileResponse, HttpResponse, HttpResponseForbidden, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.text import slugify
+from educationmodel.models import Signup, Feedback, Prediction, TrainingJob
+from educationmodel import prediction_log, reports
+from educationmodel.hashers import verify
+from educationmodel.stats import dashboard_stats, record_predictions
+from educationmodel.ml.modelstore import models
+
+# pandas, sklearn and joblib (everything else under educationmodel.ml, and the
+# roster importer) are imported inside the training and prediction views, so a
+# worker only loads them once such a route first runs (student predictions from a
+# compact model version never do); `manage.py startupbench` tracks what booting
+# a worker costs.
 import json
 import os
-import joblib
+from datetime import datetime
+import tempfile
 import csv  # <-- YOU FORGOT THIS ONE, BRO
 
-from sklearn.preprocessing import LabelEncoder
-from sklearn.linear_model import LinearRegression
-
-
-uploaded_df = None  # temporary global storage
 
 def adminDashboard(request):
-    # If some rows have null usertype, exclude them to avoid noise
-    total_students = Signup.objects.filter(usertype__iexact='student').count()
-    total_teachers = Signup.objects.filter(usertype__iexact='teacher').count()
-    return render(request, "admin_dashboard.html", {
-        "total_students": total_students,
-        "total_teachers": total_teachers,
-    })
+    # Counters are maintained on Signup save/delete; one query for all of them
+    return render(request, "admin_dashboard.html", dashboard_stats())
 
 def uploadExcel(request):
-    global uploaded_df
+    from educationmodel.ml.datastore import datasets
+    from educationmodel.ml.engines import ENGINES
+    from educationmodel.ml.search import SEARCH_MODES
+    from educationmodel.ml.uploads import dataset_for_upload
+
     if request.method == 'POST' and request.FILES['file']:
         data_file = request.FILES['file']
-        fs = FileSystemStorage()
-        filename = fs.save(data_file.name, data_file)
-        file_path = fs.path(filename)
-
-        # Check extension
-        if filename.endswith(".csv"):
-            uploaded_df = pd.read_csv(file_path)
-        elif filename.endswith(".xlsx") or filename.endswith(".xls"):
-            uploaded_df = pd.read_excel(file_path)
-        else:
-            messages.error(request, "Only CSV and Excel files are supported.")
-            return redirect("admin-dashboard")
-
-        # Handle missing values (numeric → mean, categorical → mode)
-        for col in uploaded_df.columns:
-            if uploaded_df[col].dtype in ['int64', 'float64']:
-                uploaded_df[col] = uploaded_df[col].fillna(uploaded_df[col].mean())
-            else:
-                uploaded_df[col] = uploaded_df[col].fillna(uploaded_df[col].mode()[0])
 
-        # Normalize numeric columns
-        numeric_cols = uploaded_df.select_dtypes(include=['int64', 'float64']).columns
-        uploaded_df[numeric_cols] = (uploaded_df[numeric_cols] - uploaded_df[numeric_cols].min()) / (uploaded_df[numeric_cols].max() - uploaded_df[numeric_cols].min())
+        # Store by content hash; a re-upload of the same file reuses its parsed dataset
+        try:
+            dataset_id = dataset_for_upload(data_file)
+        except ValueError as e:
+            messages.error(request, str(e))
+            return redirect("admin-dashboard")
+        request.session['dataset_id'] = dataset_id
 
         # Column selection
-        columns = uploaded_df.columns.tolist()
-        return render(request, "select_column.html", {"columns": columns})
+        columns = [c["name"] for c in datasets.meta(dataset_id)["columns"]]
+        return render(request, "select_column.html", {
+            "columns": columns,
+            "engines": [(name, label) for name, (label, _, _) in ENGINES.items()],
+            "search_modes": SEARCH_MODES.items(),
+            "search_budget": getattr(settings, "TRAINING_SEARCH_BUDGET", 300),
+        })
 
     return redirect("admin-dashboard")
 
 
 def selectColumn(request):
+    from educationmodel.ml.search import SEARCH_MODES
+
     if request.method == "POST":
         features = request.POST.getlist('features')   # multiple selection
         target = request.POST.get('target')           # single selection
@@ -73,77 +78,59 @@ def selectColumn(request):
 
         request.session['features'] = features
         request.session['target'] = target
+        request.session['engines'] = request.POST.getlist('engines')
+        request.session['incremental'] = request.POST.get('incremental') == '1'
+        request.session['search'] = request.POST.get('search') if request.POST.get('search') in SEARCH_MODES else None
+        try:
+            request.session['search_budget'] = max(float(request.POST.get('search_budget')), 1.0)
+        except (TypeError, ValueError):
+            request.session['search_budget'] = None
         return redirect("process-data")
     return redirect("admin-dashboard")
 
 
 
 def processData(request):
-    global uploaded_df
+    from educationmodel.ml import jobs
+    from educationmodel.ml.datastore import datasets
+
     features = request.session.get('features')
     target = request.session.get('target')
+    dataset_id = request.session.get('dataset_id')
+
+    if dataset_id and datasets.meta(dataset_id) is not None and features and target:
+        # Training runs in the background worker pool; the request returns at once
+        options = {"engines": request.session.get('engines') or None}
+        if request.session.get('incremental'):
+            options["incremental"] = True
+        elif request.session.get('search'):
+            options["search"] = request.session['search']
+            options["search_budget"] = request.session.get('search_budget')
+        job = jobs.enqueue(dataset_id, features, target, **options)
+        return redirect("training-job", pk=job.id)
 
-    if uploaded_df is not None and features and target:
-        # Handle missing values
-        for col in uploaded_df.columns:
-            if uploaded_df[col].dtype in ['int64', 'float64']:
-                uploaded_df[col] = uploaded_df[col].fillna(uploaded_df[col].mean())
-            else:
-                uploaded_df[col] = uploaded_df[col].fillna(uploaded_df[col].mode()[0])
+    messages.error(request, "No data to process")
+    return redirect("admin-dashboard")
 
-        # Normalize
-        numeric_cols = uploaded_df.select_dtypes(include=['int64','float64']).columns
-        uploaded_df[numeric_cols] = (uploaded_df[numeric_cols] - uploaded_df[numeric_cols].min()) / (
-            uploaded_df[numeric_cols].max() - uploaded_df[numeric_cols].min()
-        )
 
-        # Encode categorical
-        cat_cols = uploaded_df.select_dtypes(include=['object']).columns
-        le = LabelEncoder()
-        for col in cat_cols:
-            uploaded_df[col] = le.fit_transform(uploaded_df[col].astype(str))
-
-        # Final X, y
-        X = uploaded_df[features]
-        y = uploaded_df[target]
-
-        # Train linear regression model
-        model = LinearRegression()
-        model.fit(X, y)
-
-        # Save model for future predictions
-        os.makedirs("models", exist_ok=True)
-        model_path = os.path.join("models", "latest_model.pkl")
-        joblib.dump({
-            "model": model,
-            "features": features,
-            "target": target
-        }, model_path)
-
-        # Create output info
-        table_classes = "min-w-full border border-gray-300 rounded-lg text-sm"
-        tbody_classes = "divide-y divide-gray-200"
-
-        df_info = {
-            "rows": uploaded_df.shape[0],
-            "cols": uploaded_df.shape[1],
-            "features": features,
-            "target": target,
-            "sample_X": X.head(10).to_html(classes=f"dataframe {table_classes}", border=0, index=False)
-                          .replace("<tbody>", f"<tbody class='{tbody_classes}'>"),
-            "sample_y": y.head(10).to_frame().to_html(classes=f"dataframe {table_classes}", border=0, index=False)
-                          .replace("<tbody>", f"<tbody class='{tbody_classes}'>"),
-            "correlations": uploaded_df.corr(numeric_only=True).to_html(classes=f"dataframe {table_classes}", border=0)
-                          .replace("<tbody>", f"<tbody class='{tbody_classes}'>"),
-            "y_values": json.dumps(y.head(20).tolist()),
-            "corr_values": json.dumps(uploaded_df.corr(numeric_only=True)[target].dropna().to_dict()),
-            "model_saved": True
-        }
+def trainingJob(request, pk):
+    from educationmodel.ml import jobs
+    from educationmodel.ml.training import STAGES
 
-        return render(request, "process_result.html", {"df_info": df_info})
+    # the status page is polled, so it also (re)starts this worker's training threads
+    jobs.start_workers()
+    job = TrainingJob.objects.filter(id=pk).first()
+    if job is None:
+        messages.error(request, "Training job not found.")
+        return redirect("admin-dashboard")
 
-    messages.error(request, "No data to process")
-    return redirect("admin-dashboard")
+    if job.status == "done":
+        return render(request, "process_result.html", {"df_info": job.result})
+
+    return render(request, "training_job.html", {
+        "job": job,
+        "stages": [(stage, job.timings.get(stage)) for stage in STAGES],
+    })
 
 
 
@@ -162,7 +149,7 @@ def signupPageinserted(request):
             user = Signup.objects.create(
                 name=name, 
                 email=email, 
-                password=password, 
+                password=make_password(password), 
                 usertype=usertype
             )
             user.save()
@@ -171,28 +158,41 @@ def signupPageinserted(request):
 
 
 
+ROLE_DASHBOARDS = {
+    "admin": "admin-dashboard",
+    "teacher": "teacher-dashboard",
+    "student": "student-dashboard",
+}
+
+
+def _is_admin(request):
+    return request.session.get("usertype") == "admin"
+
+
 def loginpage(request):
     if request.method == 'POST':
         email = request.POST['email']
         password = request.POST['password']
-        checkdata = Signup.objects.filter(email=email, password=password).first()
-
-        if checkdata:
+        # single lookup on the unique email index; only what the session needs
+        checkdata = Signup.objects.only("id", "name", "usertype", "password").filter(email=email).first()
+
+        if checkdata is None:
+            make_password(password)  # same hashing cost as a wrong password, so unknown emails don't answer faster
+        elif verify(checkdata, password):
+            # new session key on login; the role is kept in the session so no
+            # later request has to look the user up again
+            request.session.cycle_key()
             request.session["getname"] = checkdata.name
             request.session["getid"] = checkdata.id
             request.session["usertype"] = checkdata.usertype
 
             # Redirect based on user type
-            if checkdata.usertype == 'admin':
-                return render(request, 'admin_dashboard.html')
-            elif checkdata.usertype == 'teacher':
-                return render(request, 'teacher_dashboard.html')
-            else:
-                return render(request, 'student_dashboard.html')
-        else:
-            messages.error(request, 'Invalid Credential')
-            return render(request, 'login.html')
-	
+            return redirect(ROLE_DASHBOARDS.get(checkdata.usertype, "student-dashboard"))
+
+        messages.error(request, 'Invalid Credential')
+        return render(request, 'login.html')
+    return redirect("login")
+
 
 
 # Home View
@@ -223,14 +223,14 @@ def logout(request) :
 
 
 def teacherDashboard(request): 
-    # If some rows have null usertype, exclude them to avoid noise
-    total_students = Signup.objects.filter(usertype__iexact='student').count()
-    return render(request, "teacher_dashboard.html", {
-        "total_students": total_students
-    })
+    return render(request, "teacher_dashboard.html", dashboard_stats())
 
 def studentDashboard(request):
-    return render(request, 'student_dashboard.html')
+    latest = _latest_prediction(request)
+    context = {}
+    if latest is not None:
+        context = {"prediction": latest[0], "contributions": _ranked_contributions(latest[2], latest[1])}
+    return render(request, 'student_dashboard.html', context)
 
 
 
@@ -252,13 +252,84 @@ def feedbackinsert(request) :
 
 
 
+ROSTER_PAGE_SIZE = 50
+
+
+def _prefix_search(queryset, search_fields, q):
+    """
+    Filter ``queryset`` to rows where any of ``search_fields`` starts with ``q``,
+    case-insensitively, in a form the signup_*_upper_idx indexes can serve.
+
+    On PostgreSQL istartswith compiles to UPPER(field) LIKE 'Q%', which the
+    text_pattern_ops indexes serve. SQLite cannot use an expression index for
+    LIKE, so there each field becomes a range over UPPER(field) (exact under
+    its binary collation, rechecked with istartswith), and the ids they return
+    are unioned into an IN list: with a plain OR the planner would rather walk
+    signup_usertype_id_idx in id order and test every row.
+    """
+    if connection.vendor != "sqlite":
+        match = Q()
+        for field in search_fields:
+            match |= Q(**{f"{field}__istartswith": q})
+        return queryset.filter(match)
+
+    lower = Upper(Value(q))
+    upper = Concat(lower, Value(chr(0x10FFFF)))  # highest code point: sorts after every continuation
+    ids = None
+    for field in search_fields:
+        part = queryset.model.objects.filter(
+            GreaterThanOrEqual(Upper(field), lower), LessThan(Upper(field), upper),
+            **{f"{field}__istartswith": q},
+        ).values("id")
+        ids = part if ids is None else ids.union(part)
+    return queryset.filter(id__in=ids)
+
+
+def _roster_page(request, queryset, search_fields, newest_first=False):
+    """
+    Keyset-paginate ``queryset`` by id (``?after=<id>`` / ``?before=<id>``) with an
+    optional case-insensitive prefix search ``?q=`` over ``search_fields``.
+    Cost depends on the page size, not on how deep into the roster we are.
+    With ``newest_first`` pages run from the highest id down; ``after`` and
+    ``before`` still mean next and previous page.
+    """
+    q = request.GET.get("q", "").strip()
+    if q:
+        queryset = _prefix_search(queryset, search_fields, q)
+
+    order, reverse, past, back = ("id", "-id", "id__gt", "id__lt")
+    if newest_first:
+        order, reverse, past, back = ("-id", "id", "id__lt", "id__gt")
+
+    after = request.GET.get("after")
+    before = request.GET.get("before")
+    if before and before.isdigit():
+        rows = list(queryset.filter(**{back: int(before)}).order_by(reverse)[:ROSTER_PAGE_SIZE + 1])
+        has_prev = len(rows) > ROSTER_PAGE_SIZE
+        rows = rows[:ROSTER_PAGE_SIZE][::-1]
+        has_next = True
+    else:
+        if after and after.isdigit():
+            queryset = queryset.filter(**{past: int(after)})
+        rows = list(queryset.order_by(order)[:ROSTER_PAGE_SIZE + 1])
+        has_next = len(rows) > ROSTER_PAGE_SIZE
+        rows = rows[:ROSTER_PAGE_SIZE]
+        has_prev = bool(after)
+
+    return {
+        "q": q,
+        "next_after": rows[-1].id if rows and has_next else None,
+        "prev_before": rows[0].id if rows and has_prev else None,
+    }, rows
+
+
 # -------- Students CRUD --------
 def add_student(request):
     if request.method == "POST":
         Signup.objects.create(
             name=request.POST['name'],
             email=request.POST['email'],
-            password=request.POST['password'],
+            password=make_password(request.POST['password']),
             usertype="student",
             class_name=request.POST['class_name'],
             roll_no=request.POST['roll_no']
@@ -268,15 +339,20 @@ def add_student(request):
     return render(request, "add_student.html")
 
 def students_list(request):
-    students = Signup.objects.filter(usertype="student")
-    return render(request, "students_list.html", {"students": students})
+    page, students = _roster_page(
+        request,
+        Signup.objects.filter(usertype="student").only("id", "name", "email", "class_name", "roll_no"),
+        ["name", "email", "class_name", "roll_no"],
+    )
+    return render(request, "students_list.html", {"students": students, "page": page})
 
 def edit_student(request, pk):
     student = Signup.objects.get(id=pk, usertype="student")
     if request.method == "POST":
         student.name = request.POST['name']
         student.email = request.POST['email']
-        student.password = request.POST['password']
+        if request.POST.get('password'):
+            student.password = make_password(request.POST['password'])
         student.class_name = request.POST['class_name']
         student.roll_no = request.POST['roll_no']
         student.save()
@@ -291,13 +367,91 @@ def delete_student(request, pk):
     return redirect("students-list")
 
 
+def import_roster(request):
+    # creates accounts of any role, staff included
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    from educationmodel import roster
+
+    usertype = request.POST.get("usertype") or request.GET.get("usertype") or "student"
+    if usertype not in roster.ROLE_FIELDS:
+        usertype = "student"
+    context = {"usertype": usertype, "columns": ["name", "email"] + roster.ROLE_FIELDS[usertype]}
+
+    if request.method == "POST" and request.FILES.get("file"):
+        data_file = request.FILES["file"]
+        try:
+            df = roster.read_roster(data_file, data_file.name)
+            created, errors = roster.import_roster(df, usertype)
+        except ValueError as e:
+            messages.error(request, str(e))
+            return render(request, "import_roster.html", context)
+
+        context.update({
+            "imported": True,
+            "total_rows": len(df),
+            "created": created,
+            "error_count": len(errors),
+            "errors": errors[:500],
+        })
+    return render(request, "import_roster.html", context)
+
+
+def roster_invites(request):
+    """
+    CSV of set-password links (name, email, link) for imported accounts whose
+    owner has not chosen a password yet. Links are made fresh on each download.
+    """
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    from educationmodel import roster
+    from educationmodel.hashers import set_password_tokens
+
+    usertype = request.GET.get("usertype") if request.GET.get("usertype") in roster.ROLE_FIELDS else "student"
+    accounts = roster.awaiting_password(usertype).only("id", "name", "email", "password").order_by("id")
+    rows = (
+        [signup.name, signup.email, request.build_absolute_uri(
+            reverse("set-password", args=[signup.id, set_password_tokens.make_token(signup)]))]
+        for signup in accounts.iterator()
+    )
+    response = StreamingHttpResponse(reports.iter_csv(["name", "email", "link"], rows), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{usertype}_password_links.csv"'
+    return response
+
+
+def setPasswordPage(request, pk, token):
+    """Let an imported user choose their password through the link from roster_invites."""
+    from educationmodel.hashers import set_password_tokens
+
+    signup = Signup.objects.only("id", "name", "password").filter(id=pk).first()
+    if signup is None or not set_password_tokens.check_token(signup, token):
+        messages.error(request, "This link is invalid or has expired. Please ask your administrator for a new one.")
+        return redirect("login")
+
+    if request.method == "POST":
+        password = request.POST.get("password", "")
+        if password != request.POST.get("confirm_password", ""):
+            messages.error(request, "The passwords do not match.")
+        else:
+            try:
+                validate_password(password)
+            except ValidationError as e:
+                for error in e.messages:
+                    messages.error(request, error)
+            else:
+                Signup.objects.filter(id=signup.id).update(password=make_password(password))
+                messages.success(request, "Your password is set. Please log in.")
+                return redirect("login")
+    return render(request, "set_password.html", {"name": signup.name})
+
+
 # -------- Teachers CRUD --------
 def add_teacher(request):
     if request.method == "POST":
         Signup.objects.create(
             name=request.POST['name'],
             email=request.POST['email'],
-            password=request.POST['password'],
+            password=make_password(request.POST['password']),
             usertype="teacher",
             subject=request.POST['subject'],
             department=request.POST['department']
@@ -307,15 +461,20 @@ def add_teacher(request):
     return render(request, "add_teacher.html")
 
 def teachers_list(request):
-    teachers = Signup.objects.filter(usertype="teacher")
-    return render(request, "teachers_list.html", {"teachers": teachers})
+    page, teachers = _roster_page(
+        request,
+        Signup.objects.filter(usertype="teacher").only("id", "name", "email", "subject", "department"),
+        ["name", "email", "subject", "department"],
+    )
+    return render(request, "teachers_list.html", {"teachers": teachers, "page": page})
 
 def edit_teacher(request, pk):
     teacher = Signup.objects.get(id=pk, usertype="teacher")
     if request.method == "POST":
         teacher.name = request.POST['name']
         teacher.email = request.POST['email']
-        teacher.password = request.POST['password']
+        if request.POST.get('password'):
+            teacher.password = make_password(request.POST['password'])
         teacher.subject = request.POST['subject']
         teacher.department = request.POST['department']
         teacher.save()
@@ -336,46 +495,87 @@ def studentInput(request):
     Display a form for students to input their own details (like study hours, attendance, etc.)
     Once submitted, the data will be passed through the trained model to generate a predicted score.
     """
+    from educationmodel.ml.cache import predictions
+    from educationmodel.ml.compact import encode_rows
+    from educationmodel.ml.explain import explain_rows
+    from educationmodel.ml.registry import registry
+
+    # Route by student so an A/B split keeps each student on one model version
+    model_data = registry.get(route_key=request.session.get("getid"))
+
     if request.method == "POST":
-        # Load the latest trained model
-        model_path = "models/latest_model.pkl"
-        if not os.path.exists(model_path):
+        # Use the in-memory copy of the latest trained model
+        if model_data is None:
             messages.error(request, "No trained model found. Please ask your teacher to upload a dataset first.")
             return redirect("student-dashboard")
 
-        model_data = joblib.load(model_path)
-        model = model_data["model"]
-        features = model_data["features"]
-
-        # Build input row from form fields
-        student_data = []
-        for f in features:
-            value = float(request.POST.get(f, 0))
-            student_data.append(value)
+        # Build input row from form fields; the bundle's encoder tables encode it
+        student_data = {f: request.POST.get(f, "") for f in model_data["features"]}
 
-        # Make prediction
-        prediction = model.predict([student_data])[0]
+        # Make prediction; repeat submissions of the same vector come from the cache
+        X = encode_rows(model_data, [student_data])
+        prediction = float(predictions.predict_encoded(model_data, X)[0])
+        _, explained = explain_rows(model_data, X)
+        contributions = explained[0] if explained else {}
 
-        # Save result in session for later download
+        # Keep the result for teachers and the report download; the row and the
+        # day's prediction count are written in the background. The session
+        # keeps a copy until then, as another worker may serve the next request
+        # before this one's queued row is inserted.
+        request.session["student_inputs"] = student_data
         request.session["student_prediction"] = prediction
+        request.session["student_contributions"] = contributions
+        request.session["student_predicted_at"] = timezone.now().isoformat()
         request.session["can_download"] = True
+        student_id = request.session.get("getid")
+        if student_id:
+            prediction_log.record(student_id, student_data, prediction, model_data.get("version"), contributions)
+        else:
+            prediction_log.count()
         messages.success(request, f"Your predicted performance score is {round(prediction, 2)}!")
         return redirect("student-dashboard")
 
-    # If GET request, render the form dynamically based on model features
-    model_path = "models/latest_model.pkl"
-    if os.path.exists(model_path):
-        model_data = joblib.load(model_path)
-        features = model_data["features"]
-        return render(request, "student_input.html", {"features": features})
+    # If GET request, render the form dynamically based on model features;
+    # categorical ones offer exactly the categories the model was trained on
+    if model_data is not None:
+        categorical = model_data.get("encoders", {}).get("categorical", {})
+        fields = [(f, categorical[f]["categories"] if f in categorical else None)
+                  for f in model_data["features"]]
+        return render(request, "student_input.html", {"fields": fields})
     else:
         messages.error(request, "No model available yet.")
         return redirect("student-dashboard")
 
 
+def _latest_prediction(request):
+    """(score, inputs, contributions) of the student's latest prediction, or None."""
+    session = request.session
+    in_session = None
+    if session.get("student_prediction") is not None:
+        in_session = (session["student_prediction"], session.get("student_inputs", {}),
+                      session.get("student_contributions", {}))
+
+    # Latest stored prediction of the logged-in student (possibly still queued in
+    # this worker); the session copy wins while the table has nothing newer
+    student_id = session.get("getid")
+    if student_id:
+        latest = prediction_log.pending(student_id) or \
+            Prediction.objects.filter(student_id=student_id).order_by("-created_at").first()
+        predicted_at = session.get("student_predicted_at")
+        if latest is not None and (in_session is None or predicted_at is None
+                                   or latest.created_at >= datetime.fromisoformat(predicted_at)):
+            return latest.score, latest.inputs, latest.contributions
+    return in_session
+
+
+def _ranked_contributions(contributions, inputs):
+    """[(feature, value, contribution)] with the strongest influence first."""
+    return [(f, inputs.get(f, ""), c) for f, c in sorted(contributions.items(), key=lambda kv: -abs(kv[1]))]
+
+
 def downloadPrediction(request):
-    prediction = request.session.get("student_prediction")
-    student_inputs = request.session.get("student_inputs", {})  # all filled fields
+    latest = _latest_prediction(request)
+    prediction, student_inputs, contributions = latest if latest is not None else (None, {}, {})
     if prediction is None:
         messages.error(request, "No prediction found. Please fill your info first.")
         return redirect("student-dashboard")
@@ -403,6 +603,14 @@ def downloadPrediction(request):
     writer.writerow(["Predicted Exam Score", round(prediction, 2)])
     writer.writerow([])
 
+    if contributions:
+        writer.writerow(["--- What Influenced The Prediction ---"])
+        writer.writerow(["Feature", "Value", "Contribution"])
+        for feature, value, contribution in _ranked_contributions(contributions, student_inputs):
+            writer.writerow([feature.replace("_", " ").title(), value, round(contribution, 2)])
+        writer.writerow(["Model Baseline", "", round(prediction - sum(contributions.values()), 2)])
+        writer.writerow([])
+
     writer.writerow(["=============================================================="])
     writer.writerow(["Generated by EduPredict AI Model"])
     return response
@@ -424,6 +632,168 @@ def downloadPrediction(request):
     writer.writerow([request.session.get("getname", "Unknown Student"), round(prediction, 2)])
     return response
 
+def batchPredict(request):
+    """
+    Score many students in one request.
+    - multipart upload of a CSV roster ("file") -> streamed CSV with a prediction column
+    - JSON body {"rows": [{feature: value, ...}, ...]} -> JSON list of predictions
+    With ?explain=1 per-feature contributions are added (columns / a "contributions" list).
+    """
+    from educationmodel.ml.compact import encode_rows
+    from educationmodel.ml.explain import explain_rows
+    from educationmodel.ml.registry import registry
+
+    explain = "1" in (request.GET.get("explain"), request.POST.get("explain"))
+    if request.method != "POST":
+        return redirect("teacher-dashboard")
+
+    model_data = registry.get()
+    if model_data is None:
+        if request.content_type == "application/json":
+            return JsonResponse({"error": "No trained model available."}, status=409)
+        messages.error(request, "No trained model available.")
+        return redirect("teacher-dashboard")
+
+    if request.content_type == "application/json":
+        try:
+            rows = json.loads(request.body)["rows"]
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse({"error": 'Expected a JSON body of the form {"rows": [...]}.'}, status=400)
+        X = encode_rows(model_data, rows) if rows else None
+        scores = model_data["model"].predict(X) if rows else []
+        record_predictions(len(scores))
+        result = {
+            "target": model_data["target"],
+            "predictions": [round(float(p), 4) for p in scores],
+        }
+        if explain and rows:
+            result["baseline"], result["contributions"] = explain_rows(model_data, X)
+        return JsonResponse(result)
+
+    data_file = request.FILES.get("file")
+    if data_file is None or not data_file.name.endswith(".csv"):
+        messages.error(request, "Please upload a CSV file to score.")
+        return redirect("teacher-dashboard")
+
+    from educationmodel.ml.scoring import iter_scored_csv
+
+    response = StreamingHttpResponse(
+        iter_scored_csv(data_file, model_data, on_scored=record_predictions, explain=explain),
+        content_type="text/csv")
+    response["Content-Disposition"] = 'attachment; filename="Scored_Students.csv"'
+    return response
+
+def modelVersions(request):
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    return render(request, "model_versions.html", {
+        "versions": models.versions(),
+        "pointer": models.pointer() or {},
+    })
+
+
+def activateModel(request, version):
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    if request.method == "POST":
+        try:
+            models.activate(version)
+            messages.success(request, f"Model {version} is now active.")
+        except KeyError:
+            messages.error(request, "Unknown model version.")
+    return redirect("model-versions")
+
+
+def downloadCompactModel(request, version):
+    """The compact .npz export of a linear model version, for NumPy-only prediction workers."""
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    try:
+        path = models.compact_path(version)
+    except KeyError:
+        path = None
+    if path is None:
+        messages.error(request, "This model version has no compact export.")
+        return redirect("model-versions")
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=f"{version}.npz")
+
+
+def rollbackModel(request):
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    if request.method == "POST":
+        try:
+            pointer = models.rollback()
+            messages.success(request, f"Rolled back to model {pointer['active']}.")
+        except LookupError as e:
+            messages.error(request, str(e))
+    return redirect("model-versions")
+
+
+def splitModel(request):
+    """Send a share of student predictions to a candidate version (share 0 ends the test)."""
+    if not _is_admin(request):
+        return HttpResponseForbidden()
+    if request.method == "POST":
+        candidate = request.POST.get("candidate") or None
+        try:
+            share = float(request.POST.get("share", 0)) / 100
+            models.set_split(candidate if share > 0 else None, share)
+            messages.success(request, "Traffic split updated.")
+        except (KeyError, ValueError):
+            messages.error(request, "Choose a valid candidate version and percentage.")
+    return redirect("model-versions")
+
+
+def predictionHistory(request):
+    """Stored student predictions, newest first, searchable by student name, class or model version."""
+    # every student's scores: staff only
+    if request.session.get("usertype") not in ("admin", "teacher"):
+        return redirect("login")
+    page, rows = _roster_page(
+        request,
+        Prediction.objects.select_related("student").only(
+            "id", "score", "model_version", "created_at", "student__name", "student__class_name"),
+        ["student__name", "student__class_name", "model_version"],
+        newest_first=True,
+    )
+    return render(request, "prediction_history.html", {"predictions": rows, "page": page})
+
+
+def exportPredictions(request):
+    """
+    Class- or school-wide prediction report (each student's latest prediction,
+    or every one with ?history=1), streamed as CSV while the rows are read.
+    ?format=xlsx builds a write-only workbook in a temp file and sends that.
+    """
+    if request.session.get("usertype") not in ("admin", "teacher"):
+        return redirect("login")
+    class_name = request.GET.get("class_name", "").strip() or None
+    header, rows = reports.prediction_report(
+        class_name=class_name,
+        version=request.GET.get("version") or None,
+        history=request.GET.get("history") == "1",
+    )
+    filename = f"Predictions_{slugify(class_name) if class_name else 'all_classes'}"
+
+    if request.GET.get("format") == "xlsx":
+        fh = tempfile.TemporaryFile()
+        reports.write_xlsx(header, rows, fh)
+        fh.seek(0)
+        return FileResponse(fh, as_attachment=True, filename=filename + ".xlsx")
+
+    response = StreamingHttpResponse(reports.iter_csv(header, rows), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+    return response
+
+
+def modelStats(request):
+    """Load counters for the in-process model registry and prediction cache of this worker."""
+    from educationmodel.ml.cache import predictions
+    from educationmodel.ml.registry import registry
+
+    return JsonResponse({**registry.stats(), "prediction_cache": predictions.stats()})
+
 def create_default_site_users():
     default_users = [
         {
@@ -448,7 +818,7 @@ def create_default_site_users():
 
     for user in default_users:
         if not Signup.objects.filter(email=user["email"]).exists():
-            Signup.objects.create(**user)
+            Signup.objects.create(**{**user, "password": make_password(user["password"])})
             print(f"Created default {user['usertype']} account: {user['email']}")
 
 # Safely create defaults when the app starts
@@ -13,6 +13,9 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 import os
 
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -75,12 +78,55 @@ WSGI_APPLICATION = 'EduPredict.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# EDUPREDICT_DB=sqlite (default) suits a single small server. WAL mode lets
+# readers run alongside the single writer, and IMMEDIATE transactions plus a
+# busy timeout queue concurrent writers instead of failing with "database is locked".
+# EDUPREDICT_DB=postgres for larger deployments; set EDUPREDICT_DB_POOL=1 to use
+# psycopg's connection pool, otherwise connections persist for CONN_MAX_AGE.
+
+DB_BACKEND = os.environ.get('EDUPREDICT_DB', 'sqlite')
+
+if DB_BACKEND == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('EDUPREDICT_DB_NAME', 'edupredict'),
+            'USER': os.environ.get('EDUPREDICT_DB_USER', 'edupredict'),
+            'PASSWORD': os.environ.get('EDUPREDICT_DB_PASSWORD', ''),
+            'HOST': os.environ.get('EDUPREDICT_DB_HOST', 'localhost'),
+            'PORT': os.environ.get('EDUPREDICT_DB_PORT', '5432'),
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+    if os.environ.get('EDUPREDICT_DB_POOL') == '1':
+        DATABASES['default']['CONN_MAX_AGE'] = 0  # the pool owns connection lifetime
+        DATABASES['default']['OPTIONS'] = {
+            'pool': {
+                'min_size': int(os.environ.get('EDUPREDICT_DB_POOL_MIN', 2)),
+                'max_size': int(os.environ.get('EDUPREDICT_DB_POOL_MAX', 20)),
+                'timeout': 10,
+            },
+        }
+    else:
+        DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('EDUPREDICT_DB_CONN_MAX_AGE', 60))
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('EDUPREDICT_DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                'transaction_mode': 'IMMEDIATE',
+                'timeout': 20,
+                'init_command': (
+                    'PRAGMA journal_mode=WAL;'
+                    'PRAGMA synchronous=NORMAL;'
+                    'PRAGMA temp_store=MEMORY;'
+                    'PRAGMA cache_size=-20000;'
+                    'PRAGMA mmap_size=134217728;'
+                ),
+            },
+        }
     }
-}
 
 
 # Password validation
@@ -127,3 +173,114 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Trained model versions (versions/*.pkl + CURRENT.json pointer)
+
+MODEL_ROOT = BASE_DIR / 'models'
+
+
+# Uploaded datasets (column store shared by all workers)
+
+UPLOAD_ROOT = BASE_DIR / 'uploads'           # raw uploads, stored once per content hash
+DATASET_ROOT = BASE_DIR / 'datasets'
+DATASET_STORE_MAX_BYTES = 2 * 1024 ** 3      # evict oldest uploads beyond 2 GB
+DATASET_STORE_MAX_AGE = 7 * 24 * 60 * 60     # and anything older than a week
+PROFILE_ROOT = BASE_DIR / 'profiles'         # cached correlations/summaries by content hash
+
+# Background training jobs (threads in each web worker; queue lives in the database).
+# The threads poll the table for queued jobs; a running job whose worker stops sending
+# heartbeats for TRAINING_STALE_SECONDS is marked failed.
+
+TRAINING_WORKERS = 2
+TRAINING_POLL_SECONDS = 2.0
+TRAINING_STALE_SECONDS = 120
+
+
+# Password hashing. PBKDF2 cost defaults to Django's own and is tunable per deployment:
+# ``manage.py passwordbench`` shows login latency at candidate costs. Changing it
+# re-hashes each user on next login.
+
+PASSWORD_HASHERS = [
+    'educationmodel.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('EDUPREDICT_PASSWORD_ITERATIONS',
+                                              PBKDF2PasswordHasher.iterations))
+PASSWORD_RESET_TIMEOUT = 14 * 24 * 3600   # set-password links of imported accounts
+
+
+# In-process LRU of single-student predictions (entries per worker)
+
+PREDICTION_CACHE_SIZE = 10_000
+
+
+# Student predictions are queued per worker and bulk-inserted in the background
+
+PREDICTION_FLUSH_SECONDS = 2.0
+PREDICTION_FLUSH_ROWS = 200
+
+
+# Sessions: EDUPREDICT_SESSIONS=db (default) | signed_cookies | file | cached_db | cache.
+# signed_cookies keeps sessions out of the database altogether. cached_db and cache
+# keep them in the cache, so they need one every worker process shares: set
+# EDUPREDICT_CACHE=redis | memcached | file | db and EDUPREDICT_CACHE_LOCATION
+# (a URL, a directory, or a table made with manage.py createcachetable).
+# Compare them with: manage.py loadtest --scenario student --sessions db --sessions signed_cookies
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+}
+CACHE_BACKEND = os.environ.get('EDUPREDICT_CACHE', 'locmem')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': os.environ.get('EDUPREDICT_CACHE_LOCATION', 'edupredict'),
+        'OPTIONS': {'MAX_ENTRIES': 10_000} if CACHE_BACKEND in ('locmem', 'file', 'db') else {},
+    }
+}
+
+SESSION_BACKENDS = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'file': 'django.contrib.sessions.backends.file',
+}
+SESSION_BACKEND = os.environ.get('EDUPREDICT_SESSIONS', 'db')
+if SESSION_BACKEND in ('cached_db', 'cache') and CACHE_BACKEND == 'locmem':
+    # each worker would see its own copy: logouts and session edits would not propagate
+    raise ImproperlyConfigured(
+        f"EDUPREDICT_SESSIONS={SESSION_BACKEND} needs a cache shared by every worker; "
+        "set EDUPREDICT_CACHE to redis, memcached, file or db.")
+SESSION_ENGINE = SESSION_BACKENDS[SESSION_BACKEND]
+
+
+# Model selection: every chosen engine is k-fold cross-validated on a process pool
+
+TRAINING_CV_FOLDS = 5
+TRAINING_CV_JOBS = -1    # joblib n_jobs; -1 uses every core
+
+
+# Hyperparameter search (optional on the training page): candidates run on the same
+# process pool as model selection, sharing the preprocessed data through memory maps
+
+TRAINING_SEARCH_BUDGET = 300      # seconds; no new round starts after this
+TRAINING_SEARCH_PATIENCE = 3      # rounds without improvement before stopping early
+TRAINING_SEARCH_CANDIDATES = 30   # settings drawn by randomized search
+
+
+# Linear model versions are also saved as compact .npz files (arrays + JSON, no pickle)
+# that educationmodel.ml.compact scores with NumPy alone; prediction workers serve
+# those versions from the .npz rather than unpickling the sklearn bundle
+
+MODEL_COMPACT_EXPORT = True
+MODEL_SERVE_COMPACT = True
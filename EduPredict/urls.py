@@ -14,6 +14,7 @@ urlpatterns = [
 
     path('feedbackinserted/', auth.feedbackinsert),
     path('forgot-password/', auth.forgotPasswordPage, name='forgot-password'),
+    path('set-password/<int:pk>/<str:token>/', auth.setPasswordPage, name='set-password'),
 
     # Pages 
     path('home/', auth.homePage, name='home'),
@@ -29,12 +30,15 @@ urlpatterns = [
     path('upload-excel/', auth.uploadExcel, name='upload-excel'),
     path('select-column/', auth.selectColumn, name='select-column'),
     path('process-data/', auth.processData, name='process-data'),
+    path('training-jobs/<int:pk>/', auth.trainingJob, name='training-job'),
 
     # Students CRUD
     path("students/add/", auth.add_student, name="add-student"),
     path("students/", auth.students_list, name="students-list"),
     path("students/edit/<int:pk>/", auth.edit_student, name="edit-student"),
     path("students/delete/<int:pk>/", auth.delete_student, name="delete-student"),
+    path("roster/import/", auth.import_roster, name="import-roster"),
+    path("roster/invites/", auth.roster_invites, name="roster-invites"),
 
     # Teachers CRUD
     path("teachers/add/", auth.add_teacher, name="add-teacher"),
@@ -45,4 +49,15 @@ urlpatterns = [
     # NEW — Student Prediction Routes
     path("student/input/", auth.studentInput, name="student-input"),
     path("student/download/", auth.downloadPrediction, name="download-prediction"),
+    path("predict/batch/", auth.batchPredict, name="batch-predict"),
+    path("model/stats/", auth.modelStats, name="model-stats"),
+    path("predictions/", auth.predictionHistory, name="prediction-history"),
+    path("predictions/export/", auth.exportPredictions, name="export-predictions"),
+
+    # Model versions
+    path("models/", auth.modelVersions, name="model-versions"),
+    path("models/<str:version>/activate/", auth.activateModel, name="activate-model"),
+    path("models/<str:version>/compact/", auth.downloadCompactModel, name="download-compact-model"),
+    path("models/rollback/", auth.rollbackModel, name="rollback-model"),
+    path("models/split/", auth.splitModel, name="split-model"),
 ]
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class EducationmodelConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'educationmodel'
+
+    def ready(self):
+        from educationmodel import signals  # noqa: F401
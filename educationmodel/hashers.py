@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher, check_password, identify_hasher, is_password_usable, make_password,
+)
+from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.utils.crypto import constant_time_compare
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 whose work factor comes from ``PASSWORD_HASH_ITERATIONS``.
+
+    The algorithm name is unchanged, so hashes stay readable by Django's stock
+    hasher; changing the setting makes ``must_update`` true for older hashes
+    and they are re-encoded at the new cost on the user's next login.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
+
+
+def is_hashed(encoded):
+    try:
+        identify_hasher(encoded)
+    except ValueError:
+        return False
+    return True
+
+
+def verify(signup, raw_password):
+    """
+    Check ``raw_password`` against ``signup.password``. A hash made at an
+    outdated work factor, or a plaintext password left from before hashing,
+    is re-encoded at the current cost once the password is known to match.
+    """
+    def upgrade(raw):
+        signup.password = make_password(raw)
+        # update() rather than save(): no counter signals, no extra SELECT
+        type(signup).objects.filter(pk=signup.pk).update(password=signup.password)
+
+    if is_hashed(signup.password) or not is_password_usable(signup.password):
+        # check_password also spends a hash on unusable (not yet set) passwords
+        return check_password(raw_password, signup.password, setter=upgrade)
+    if signup.password and constant_time_compare(signup.password, raw_password):
+        upgrade(raw_password)
+        return True
+    return False
+
+
+class SetPasswordTokenGenerator(PasswordResetTokenGenerator):
+    """
+    Tokens for the set-password links of imported accounts. A token is bound to
+    the account's current password hash, so it stops working once used, and
+    expires after ``PASSWORD_RESET_TIMEOUT``.
+    """
+    key_salt = "educationmodel.hashers.SetPasswordTokenGenerator"
+
+    def _make_hash_value(self, signup, timestamp):
+        return f"{signup.pk}{signup.password}{timestamp}"
+
+
+set_password_tokens = SetPasswordTokenGenerator()
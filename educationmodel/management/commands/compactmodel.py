@@ -0,0 +1,97 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from educationmodel.ml import compact
+from educationmodel.ml.modelstore import models
+
+
+# Each cold start runs in a fresh interpreter: load the artifact, score one row,
+# report wall time and peak RSS. Neither script imports Django. Peak RSS comes from
+# VmHWM, which (unlike ru_maxrss) does not carry over the parent's high-water mark.
+_RSS = """
+def peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmHWM")) / 1024
+    except (OSError, StopIteration):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+"""
+_PICKLE_START = """
+import json, sys, time
+start = time.perf_counter()
+import joblib, pandas as pd
+from educationmodel.ml import pipeline
+bundle = joblib.load(sys.argv[1])
+score = float(bundle["model"].predict(pipeline.transform(bundle, pd.DataFrame([json.loads(sys.argv[2])])))[0])
+print(json.dumps({"seconds": time.perf_counter() - start, "score": score,
+                  "rss_mb": peak_rss_mb(),
+                  "sklearn": "sklearn" in sys.modules}))
+"""
+
+_COMPACT_START = """
+import json, sys, time
+start = time.perf_counter()
+from educationmodel.ml.compact import CompactModel
+model = CompactModel.load(sys.argv[1])
+score = float(model.predict([json.loads(sys.argv[2])])[0])
+print(json.dumps({"seconds": time.perf_counter() - start, "score": score,
+                  "rss_mb": peak_rss_mb(),
+                  "sklearn": "sklearn" in sys.modules}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the compact .npz export of linear model versions (default: the active "
+        "one). With --bench, compare a prediction worker's cold start (time to first "
+        "score, peak RSS) loading the pickle versus the compact file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("versions", nargs="*")
+        parser.add_argument("--bench", action="store_true")
+        parser.add_argument("--runs", type=int, default=5, help="Cold starts per format with --bench.")
+
+    def handle(self, *args, **options):
+        versions = options["versions"] or [(models.pointer() or {}).get("active")]
+        if not all(versions):
+            raise CommandError("No active model version.")
+        for version in versions:
+            try:
+                bundle = models.load(version)
+            except (KeyError, FileNotFoundError):
+                raise CommandError(f"Unknown model version {version}.")
+            if not compact.supports(bundle):
+                raise CommandError(f"{version} is not a linear model; only those have a compact export.")
+            path = models.compact_path(version) or models.export_compact(version)
+            self.stdout.write(f"{version}: {path}")
+            if options["bench"]:
+                self._bench(version, bundle, path, options["runs"])
+
+    def _bench(self, version, bundle, path, runs):
+        row = {f: "" for f in bundle["features"]}
+        for f, mean in zip(bundle["numeric_features"], bundle["encoders"]["numeric"]["mean"]):
+            row[f] = mean
+        for f in bundle["categorical_features"]:
+            row[f] = bundle["encoders"]["categorical"][f]["categories"][0]
+
+        self.stdout.write(f"{'format':>8}{'size KB':>10}{'start ms':>10}{'RSS MB':>9}  sklearn  score")
+        for label, script, artifact in (("pickle", _PICKLE_START, models._version_path(version, "pkl")),
+                                        ("compact", _COMPACT_START, path)):
+            results = [self._cold_start(script, artifact, row) for _ in range(runs)]
+            seconds = sorted(r["seconds"] for r in results)[len(results) // 2]
+            rss = max(r["rss_mb"] for r in results)
+            size = os.path.getsize(artifact) / 1024
+            self.stdout.write(f"{label:>8}{size:>10.1f}{seconds * 1000:>10.1f}{rss:>9.1f}  "
+                              f"{'yes' if results[0]['sklearn'] else 'no':>7}  {results[0]['score']:.6f}")
+
+    def _cold_start(self, script, artifact, row):
+        out = subprocess.run([sys.executable, "-c", _RSS + script, artifact, json.dumps(row)],
+                             cwd=str(settings.BASE_DIR), capture_output=True, text=True, check=True)
+        return json.loads(out.stdout)
@@ -0,0 +1,149 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+
+from educationmodel.ml.registry import registry
+
+
+SCENARIOS = ("login", "predict", "feedback", "student")
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _sample_inputs(bundle):
+    """One form submission built from the model's own training statistics."""
+    tables = bundle.get("encoders", {})
+    data = {f: str(round(mean, 2)) for f, mean in
+            zip(bundle.get("numeric_features", []), tables.get("numeric", {}).get("mean", []))}
+    for f, table in tables.get("categorical", {}).items():
+        data[f] = table["categories"][table["fill"]] if table["categories"] else ""
+    for f in bundle["features"]:
+        data.setdefault(f, "")
+    return data
+
+
+def _student_visit(client, inputs):
+    """One student session: dashboard, form, submit, report download."""
+    for response in (
+        client.get("/student-dashboard/"),
+        client.get("/student/input/"),
+        client.post("/student/input/", inputs),
+        client.get("/student/download/"),
+    ):
+        if response.status_code >= 400:
+            return response
+    return response
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive concurrent logins, predictions, feedback posts and whole student "
+        "visits through the views against the configured database and report "
+        "throughput and latency. Run it once per database backend "
+        "(EDUPREDICT_DB=sqlite / postgres) to compare them; --sessions repeats "
+        "the run for each named session backend."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--requests", type=int, default=200, help="Requests (student visits) per thread and scenario.")
+        parser.add_argument("--scenario", choices=SCENARIOS, action="append",
+                            help="Scenario to run (repeatable); defaults to all.")
+        parser.add_argument("--email", default="student@edupredict.com")
+        parser.add_argument("--password", default="study123")
+        parser.add_argument("--sessions", choices=sorted(settings.SESSION_BACKENDS), action="append",
+                            help="Session backend to compare (repeatable); defaults to the configured one.")
+
+    def handle(self, *args, **options):
+        scenarios = options["scenario"] or list(SCENARIOS)
+        db = settings.DATABASES["default"]
+        self.stdout.write(f"backend: {connection.vendor} ({db['ENGINE']})")
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                for pragma in ("journal_mode", "synchronous", "busy_timeout"):
+                    cursor.execute(f"PRAGMA {pragma}")
+                    self.stdout.write(f"  {pragma}={cursor.fetchone()[0]}")
+        else:
+            pool = db.get("OPTIONS", {}).get("pool")
+            self.stdout.write(f"  CONN_MAX_AGE={db.get('CONN_MAX_AGE')} pool={pool or 'off'}")
+
+        engines = {name: settings.SESSION_BACKENDS[name] for name in options["sessions"] or []} or \
+            {settings.SESSION_ENGINE.rsplit(".", 1)[-1]: settings.SESSION_ENGINE}
+        self.stdout.write(f"{'sessions':<16}{'scenario':<10}{'requests':>10}{'errors':>8}"
+                          f"{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, engine in engines.items():
+            with override_settings(SESSION_ENGINE=engine):
+                for scenario in scenarios:
+                    if scenario in ("predict", "student") and registry.get() is None:
+                        self.stdout.write(f"{name:<16}{scenario:<10}  skipped: no trained model")
+                        continue
+                    latencies, errors, elapsed = self._run(scenario, options)
+                    latencies.sort()
+                    self.stdout.write(
+                        f"{name:<16}{scenario:<10}{len(latencies):>10}{errors:>8}{len(latencies) / elapsed:>10.1f}"
+                        f"{_percentile(latencies, 50) * 1000:>10.2f}{_percentile(latencies, 99) * 1000:>10.2f}"
+                    )
+
+    def _run(self, scenario, options):
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+        credentials = {"email": options["email"], "password": options["password"]}
+        inputs = _sample_inputs(registry.get()) if scenario in ("predict", "student") else None
+        barrier = threading.Barrier(options["threads"] + 1)
+
+        def worker():
+            client = Client(HTTP_HOST="localhost")
+            local, failed = [], 0
+            # every worker logs in once first; predict/feedback reuse that session
+            client.post("/loginresult/", credentials)
+            if "getid" not in client.session:
+                barrier.abort()
+                return
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                return
+            try:
+                for _ in range(options["requests"]):
+                    start = time.perf_counter()
+                    if scenario == "login":
+                        response = client.post("/loginresult/", credentials)
+                    elif scenario == "predict":
+                        response = client.post("/student/input/", inputs)
+                    elif scenario == "student":
+                        response = _student_visit(client, inputs)
+                    else:
+                        response = client.post("/feedbackinserted/", {
+                            "name": "Load Test", "email": options["email"],
+                            "subject": "load test", "message": "load test",
+                        })
+                    local.append(time.perf_counter() - start)
+                    if response.status_code >= 400:
+                        failed += 1
+            finally:
+                with lock:
+                    latencies.extend(local)
+                    errors[0] += failed
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        for t in threads:
+            t.start()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            raise CommandError(f"Could not log in as {options['email']}.")
+        start = time.perf_counter()
+        for t in threads:
+            t.join()
+        return latencies, errors[0], time.perf_counter() - start
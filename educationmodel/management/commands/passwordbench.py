@@ -0,0 +1,58 @@
+import threading
+import time
+
+from django.contrib.auth.hashers import check_password
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from educationmodel.hashers import TunedPBKDF2PasswordHasher
+from educationmodel.management.commands.loadtest import _percentile
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password-check latency (p50/p99) and logins per second under "
+        "concurrent load at candidate PBKDF2 work factors, to pick "
+        "EDUPREDICT_PASSWORD_ITERATIONS. Use 'loadtest --scenario login' for the "
+        "full request path at the configured cost."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, action="append",
+                            help="Work factor to try (repeatable); defaults to 100k, 300k, 600k and 1M.")
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--logins", type=int, default=20, help="Password checks per thread.")
+
+    def handle(self, *args, **options):
+        hasher = TunedPBKDF2PasswordHasher()
+        self.stdout.write(f"{'iterations':>10}{'checks':>8}{'logins/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for iterations in options["iterations"] or [100_000, 300_000, 600_000, 1_000_000]:
+            with override_settings(PASSWORD_HASH_ITERATIONS=iterations):
+                encoded = hasher.encode("benchmark-password", hasher.salt())
+                latencies, elapsed = self._run(encoded, options)
+            latencies.sort()
+            self.stdout.write(
+                f"{iterations:>10}{len(latencies):>8}{len(latencies) / elapsed:>10.1f}"
+                f"{_percentile(latencies, 50) * 1000:>10.1f}{_percentile(latencies, 99) * 1000:>10.1f}"
+            )
+
+    def _run(self, encoded, options):
+        latencies = []
+        lock = threading.Lock()
+
+        def worker():
+            local = []
+            for _ in range(options["logins"]):
+                start = time.perf_counter()
+                check_password("benchmark-password", encoded)
+                local.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(local)
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return latencies, time.perf_counter() - start
@@ -0,0 +1,64 @@
+import json
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from educationmodel.management.commands.compactmodel import _RSS
+
+
+HEAVY_MODULES = ["pandas", "sklearn", "joblib", "scipy", "numpy", "openpyxl"]
+
+# What a fresh web worker does: set up Django and load the URLconf (and with it
+# every view module), then, as the first training or prediction request would,
+# import the ML code. Wall time and peak RSS are reported after each phase.
+_WORKER_START = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.conf import settings
+importlib.import_module(settings.ROOT_URLCONF)
+boot = {"seconds": time.perf_counter() - start, "rss_mb": peak_rss_mb(),
+        "loaded": [m for m in json.loads(sys.argv[1]) if m in sys.modules]}
+start = time.perf_counter()
+import pandas
+from educationmodel.ml import registry, scoring, training
+first_ml = {"seconds": time.perf_counter() - start, "rss_mb": peak_rss_mb()}
+print(json.dumps({"boot": boot, "first_ml": first_ml}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure what starting a web worker costs: time and peak RSS to set up Django "
+        "and load the URLconf, and the extra cost when the first training or "
+        "prediction request imports the ML stack. Each run is a fresh interpreter. "
+        "--check fails if pandas, sklearn, joblib or scipy load at boot."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--check", action="store_true",
+                            help="Exit with an error if heavy libraries are imported at boot.")
+
+    def handle(self, *args, **options):
+        results = [self._start() for _ in range(options["runs"])]
+
+        self.stdout.write(f"{'phase':>10}{'median ms':>11}{'peak RSS MB':>13}")
+        for phase in ("boot", "first_ml"):
+            seconds = sorted(r[phase]["seconds"] for r in results)[len(results) // 2]
+            rss = max(r[phase]["rss_mb"] for r in results)
+            self.stdout.write(f"{phase:>10}{seconds * 1000:>11.1f}{rss:>13.1f}")
+
+        loaded = sorted({m for r in results for m in r["boot"]["loaded"]})
+        self.stdout.write(f"Loaded at boot: {', '.join(loaded) or 'none of ' + ', '.join(HEAVY_MODULES)}")
+        if options["check"] and set(loaded) & {"pandas", "sklearn", "joblib", "scipy"}:
+            raise CommandError("Heavy ML libraries are imported when a worker boots.")
+
+    def _start(self):
+        # the child inherits DJANGO_SETTINGS_MODULE from manage.py
+        out = subprocess.run([sys.executable, "-c", _RSS + _WORKER_START, json.dumps(HEAVY_MODULES)],
+                             cwd=str(settings.BASE_DIR), capture_output=True, text=True, check=True)
+        return json.loads(out.stdout.splitlines()[-1])
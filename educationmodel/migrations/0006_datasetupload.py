@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0005_trainingjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('original_name', models.CharField(max_length=255)),
+                ('size', models.BigIntegerField()),
+                ('dataset_id', models.CharField(blank=True, max_length=64)),
+                ('uploaded_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
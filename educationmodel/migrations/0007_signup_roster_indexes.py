@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:58
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0006_datasetupload'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(fields=['usertype', 'id'], name='signup_usertype_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='signup_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='signup_email_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(django.db.models.functions.text.Upper('class_name'), name='signup_class_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(django.db.models.functions.text.Upper('roll_no'), name='signup_roll_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:58
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def count_existing_signups(apps, schema_editor):
+    Signup = apps.get_model('educationmodel', 'Signup')
+    DashboardCounter = apps.get_model('educationmodel', 'DashboardCounter')
+
+    counts = Counter()
+    for usertype, class_name in Signup.objects.values_list('usertype', 'class_name').iterator():
+        if usertype:
+            counts['role:' + usertype.lower()] += 1
+            if usertype.lower() == 'student' and class_name:
+                counts['class:' + class_name] += 1
+    DashboardCounter.objects.bulk_create([DashboardCounter(key=k, value=v) for k, v in counts.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0007_signup_roster_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=150, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_existing_signups, migrations.RunPython.noop),
+    ]
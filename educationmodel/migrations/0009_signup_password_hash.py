@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:04
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.db import migrations, models
+
+
+def hash_plaintext_passwords(apps, schema_editor):
+    # full-cost hashes: these are live accounts, not a fresh roster import.
+    # PBKDF2 releases the GIL, so the batches are spread over a thread per CPU.
+    Signup = apps.get_model('educationmodel', 'Signup')
+    plaintext = []
+    for pk, password in Signup.objects.values_list('id', 'password').iterator():
+        try:
+            identify_hasher(password)
+        except ValueError:
+            if password:
+                plaintext.append((pk, password))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        for start in range(0, len(plaintext), 1000):
+            batch = plaintext[start:start + 1000]
+            hashed = pool.map(make_password, [password for _, password in batch])
+            Signup.objects.bulk_update(
+                [Signup(id=pk, password=encoded) for (pk, _), encoded in zip(batch, hashed)],
+                ['password'],
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0008_dashboardcounter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='signup',
+            name='password',
+            field=models.CharField(max_length=128),
+        ),
+        migrations.RunPython(hash_plaintext_passwords, migrations.RunPython.noop),
+    ]
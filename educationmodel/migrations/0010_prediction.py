@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0009_signup_password_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Prediction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('inputs', models.JSONField(default=dict)),
+                ('score', models.FloatField()),
+                ('model_version', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField()),
+                ('student', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='predictions', to='educationmodel.signup')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', '-created_at'], name='prediction_student_idx'), models.Index(fields=['model_version', '-created_at'], name='prediction_version_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0010_prediction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prediction',
+            name='contributions',
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+UPPER_INDEXES = {
+    "signup_name_upper_idx": "name",
+    "signup_email_upper_idx": "email",
+    "signup_class_upper_idx": "class_name",
+    "signup_roll_upper_idx": "roll_no",
+}
+
+
+def make_indexes_searchable(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        # istartswith is UPPER(col::text) LIKE 'Q%': a btree only serves it with a
+        # pattern opclass (outside the C collation). Same names, so the model state holds.
+        for name, column in UPPER_INDEXES.items():
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+            schema_editor.execute(
+                f'CREATE INDEX "{name}" ON "educationmodel_signup" ((UPPER("{column}"::text)) text_pattern_ops)')
+    elif connection.vendor == "sqlite":
+        # without statistics the planner prefers signup_usertype_id_idx for every
+        # roster query, including searches the UPPER() indexes answer directly
+        schema_editor.execute("ANALYZE")
+
+
+def restore_plain_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for name, column in UPPER_INDEXES.items():
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+            schema_editor.execute(f'CREATE INDEX "{name}" ON "educationmodel_signup" (UPPER("{column}"))')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('educationmodel', '0013_trainingjob_heartbeat_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(make_indexes_searchable, restore_plain_indexes),
+    ]
@@ -0,0 +1,103 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from django.conf import settings
+
+
+def _maxsize():
+    return int(getattr(settings, "PREDICTION_CACHE_SIZE", 10_000))
+
+
+class PredictionCache:
+    """
+    Per-process LRU of model outputs keyed on ``(model version, encoded row)``.
+
+    Rows are keyed after encoding, so inputs that only differ in formatting
+    ("5" vs "5.0", category spelled the same way) share an entry, and the key
+    can never outlive the encoder tables of its version. Entries for versions
+    the registry no longer serves are dropped as soon as it swaps bundles.
+    """
+
+    def __init__(self, maxsize=None):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize if self._maxsize is not None else _maxsize()
+
+    @staticmethod
+    def _keys(version, X):
+        # float64, and -0.0 folded into 0.0 so equal vectors hash equally
+        X = np.ascontiguousarray(X, dtype=np.float64) + 0.0
+        return [(version, row.tobytes()) for row in X]
+
+    def predict(self, bundle, df):
+        """Predictions for every row of ``df``; only cache misses reach the model."""
+        from educationmodel.ml.scoring import encode_frame
+
+        return self.predict_encoded(bundle, encode_frame(bundle, df))
+
+    def predict_encoded(self, bundle, X):
+        """Like ``predict`` for an already encoded matrix ``X``."""
+        keys = self._keys(bundle.get("version"), X)
+        out = np.empty(len(keys), dtype=np.float64)
+
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                value = self._entries.get(key)
+                if value is None:
+                    missing.append(i)
+                else:
+                    self._entries.move_to_end(key)
+                    out[i] = value
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            out[missing] = bundle["model"].predict(X[missing])
+            maxsize = self.maxsize
+            with self._lock:
+                for i in missing:
+                    self._entries[keys[i]] = float(out[i])
+                    self._entries.move_to_end(keys[i])
+                while len(self._entries) > maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return out
+
+    def retain(self, versions):
+        """Forget every entry whose model version is not in ``versions``."""
+        versions = set(versions)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] not in versions]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+predictions = PredictionCache()
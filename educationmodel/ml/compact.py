@@ -0,0 +1,194 @@
+import csv
+import json
+import math
+import sys
+
+import numpy as np
+
+
+FORMAT = "edupredict-linear/1"
+
+
+def supports(bundle):
+    """Whether ``bundle`` holds a single-output linear model with encoder tables."""
+    model = bundle.get("model")
+    return (
+        "encoders" in bundle
+        and hasattr(model, "coef_") and np.ndim(model.coef_) == 1
+        and np.ndim(model.intercept_) == 0
+    )
+
+
+def export(bundle, path):
+    """
+    Write ``bundle`` to ``path`` (a file name or open binary file) as a compact
+    ``.npz``: plain arrays for the coefficients, intercept and numeric encoder
+    tables plus a JSON header with the features and category tables.
+    """
+    if not supports(bundle):
+        raise ValueError("Only linear models can be exported in the compact format.")
+    tables = bundle["encoders"]
+    header = {
+        "format": FORMAT,
+        "version": bundle.get("version"),
+        "engine": bundle.get("engine"),
+        "features": list(bundle["features"]),
+        "target": bundle.get("target"),
+        "numeric": list(bundle["numeric_features"]),
+        "categorical": {
+            f: tables["categorical"][f] for f in bundle["categorical_features"]
+        },
+    }
+    np.savez(
+        path,
+        header=np.frombuffer(json.dumps(header).encode(), dtype=np.uint8),
+        coef=np.asarray(bundle["model"].coef_, dtype=np.float64),
+        intercept=np.float64(bundle["model"].intercept_),
+        mean=np.asarray(tables["numeric"]["mean"], dtype=np.float64),
+        scale=np.asarray(tables["numeric"]["scale"], dtype=np.float64),
+        offset=np.asarray(tables["numeric"]["offset"], dtype=np.float64),
+    )
+
+
+def _number(value):
+    # pandas.to_numeric(errors="coerce") semantics: anything unparseable is missing
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _missing(value):
+    return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
+
+
+class _Linear:
+    """The ``model`` of a bundle served from a compact export; predicts as sklearn's linear models do."""
+
+    def __init__(self, coef, intercept):
+        self.coef_ = coef
+        self.intercept_ = intercept
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
+class CompactModel:
+    """
+    A linear model loaded from a compact artifact.
+
+    Loading reads a few arrays with ``allow_pickle=False``: nothing is
+    unpickled, and this module needs only NumPy and the standard library, so a
+    prediction worker can score without importing sklearn or pandas.
+    ``predict`` takes raw rows (dicts of field -> value) and returns the same
+    scores as the full bundle.
+    """
+
+    def __init__(self, header, coef, intercept, mean, scale, offset):
+        if header.get("format") != FORMAT:
+            raise ValueError(f"Unsupported model format {header.get('format')!r}.")
+        self.header = header
+        self.version = header["version"]
+        self.features = header["features"]
+        self.numeric = header["numeric"]
+        self.categorical = list(header["categorical"])
+        self.codes = {
+            f: ({c: i for i, c in enumerate(table["categories"])}, table["fill"])
+            for f, table in header["categorical"].items()
+        }
+        self.coef = coef
+        self.intercept = float(intercept)
+        self.mean, self.scale, self.offset = mean, scale, offset
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(data["header"].tobytes().decode())
+            return cls(header, data["coef"], data["intercept"], data["mean"], data["scale"], data["offset"])
+
+    def encode(self, rows):
+        """Model input matrix for ``rows``, as ``pipeline.transform`` builds it."""
+        rows = list(rows)
+        X = np.empty((len(rows), len(self.numeric) + len(self.categorical)), dtype=np.float64)
+        if self.numeric:
+            block = np.array([[_number(row.get(f)) for f in self.numeric] for row in rows],
+                             dtype=np.float64).reshape(len(rows), len(self.numeric))
+            block = np.where(np.isnan(block), self.mean, block)
+            X[:, :len(self.numeric)] = block * self.scale + self.offset
+        for j, f in enumerate(self.categorical, start=len(self.numeric)):
+            lookup, fill = self.codes[f]
+            X[:, j] = [fill if _missing(v) else lookup.get(str(v), -1) for v in (row.get(f) for row in rows)]
+        return X
+
+    def predict(self, rows):
+        return self.encode(rows) @ self.coef + self.intercept
+
+    def as_bundle(self):
+        """
+        A bundle dict for the registry and the prediction views: the fields,
+        encoder tables and a ``model`` that scores encoded rows, plus this
+        object under ``compact`` so raw rows are encoded without pandas.
+        """
+        return {
+            "version": self.version,
+            "engine": self.header.get("engine"),
+            "features": self.features,
+            "target": self.header.get("target"),
+            "numeric_features": self.numeric,
+            "categorical_features": self.categorical,
+            "encoders": {
+                "numeric": {"mean": self.mean.tolist(), "scale": self.scale.tolist(), "offset": self.offset.tolist()},
+                "categorical": self.header["categorical"],
+            },
+            "model": _Linear(self.coef, self.intercept),
+            "compact": self,
+        }
+
+
+def encode_rows(bundle, rows):
+    """
+    Model input matrix for raw ``rows`` (dicts of field -> value). Bundles
+    served from a compact export encode with NumPy alone; any other bundle goes
+    through pandas and its encoder tables (``scoring.encode_frame``).
+    """
+    if "compact" in bundle:
+        return bundle["compact"].encode(rows)
+    import pandas as pd
+    from educationmodel.ml.scoring import encode_frame
+
+    return encode_frame(bundle, pd.DataFrame(list(rows)))
+
+
+def main(argv=None):
+    """
+    Score CSV rows from stdin with the artifact named on the command line and
+    write them to stdout with a prediction column appended::
+
+        python -m educationmodel.ml.compact models/versions/<version>.npz < students.csv > scored.csv
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        sys.stderr.write("usage: python -m educationmodel.ml.compact MODEL.npz < input.csv > output.csv\n")
+        return 2
+    model = CompactModel.load(argv[0])
+    reader = csv.DictReader(sys.stdin)
+    writer = csv.writer(sys.stdout)
+    writer.writerow(list(reader.fieldnames or []) + ["Predicted_" + model.header["target"]])
+    batch = []
+    for row in reader:
+        batch.append(row)
+        if len(batch) == 5000:
+            _write_scored(writer, model, batch)
+            batch = []
+    _write_scored(writer, model, batch)
+    return 0
+
+
+def _write_scored(writer, model, batch):
+    if batch:
+        for row, score in zip(batch, model.predict(batch)):
+            writer.writerow(list(row.values()) + [float(score)])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
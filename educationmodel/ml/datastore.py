@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+
+def _root():
+    return str(getattr(settings, "DATASET_ROOT", "datasets"))
+
+
+class DatasetStore:
+    """
+    On-disk store for uploaded datasets, keyed by upload ID.
+
+    Each dataset is a directory with one ``.npy`` file per column plus a
+    ``meta.json`` describing the columns. Numeric columns are stored as-is and
+    text columns as integer category codes, so any worker can reopen a dataset
+    with ``np.load(mmap_mode=...)`` without parsing or copying the data.
+    """
+
+    def __init__(self, root=None, max_bytes=None, max_age_seconds=None):
+        self._root = root
+        self.max_bytes = max_bytes if max_bytes is not None else getattr(
+            settings, "DATASET_STORE_MAX_BYTES", 2 * 1024 ** 3)
+        self.max_age_seconds = max_age_seconds if max_age_seconds is not None else getattr(
+            settings, "DATASET_STORE_MAX_AGE", 7 * 24 * 3600)
+
+    @property
+    def root(self):
+        return self._root or _root()
+
+    def _dir(self, dataset_id):
+        # IDs come from sessions/URLs; never let them escape the store root
+        if not dataset_id or not all(c in "0123456789abcdef" for c in dataset_id):
+            raise KeyError(dataset_id)
+        return os.path.join(self.root, dataset_id)
+
+    def begin(self):
+        """Reserve a new dataset ID and return ``(dataset_id, staging_dir)`` for column files."""
+        dataset_id = uuid.uuid4().hex
+        tmp_dir = self._dir(dataset_id) + ".tmp"
+        os.makedirs(tmp_dir)
+        return dataset_id, tmp_dir
+
+    def commit(self, dataset_id, rows, columns, **extra):
+        """Publish a staged dataset; it becomes visible to every worker at once."""
+        final_dir = self._dir(dataset_id)
+        tmp_dir = final_dir + ".tmp"
+        meta = {
+            "id": dataset_id,
+            "rows": int(rows),
+            "columns": columns,
+            "content_hash": self._content_hash(tmp_dir, columns),
+            "created": time.time(),
+            **extra,
+        }
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_dir, final_dir)
+
+        self.evict(keep=dataset_id)
+        return dataset_id
+
+    @staticmethod
+    def _content_hash(directory, columns):
+        """SHA-256 over the column layout and column files: equal data -> equal hash."""
+        digest = hashlib.sha256(json.dumps(columns, sort_keys=True).encode())
+        for entry in columns:
+            with open(os.path.join(directory, entry["file"]), "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def save(self, df):
+        """Persist an in-memory ``df`` and return its new dataset ID."""
+        dataset_id, tmp_dir = self.begin()
+
+        columns = []
+        for i, col in enumerate(df.columns):
+            series = df[col]
+            entry = {"name": str(col), "file": f"c{i}.npy"}
+            if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                values = series.to_numpy()
+                entry["kind"] = "numeric"
+            else:
+                cat = series.astype("category")
+                values = cat.cat.codes.to_numpy()
+                entry["kind"] = "category"
+                entry["categories"] = [str(c) for c in cat.cat.categories]
+            np.save(os.path.join(tmp_dir, entry["file"]), values, allow_pickle=False)
+            columns.append(entry)
+
+        return self.commit(dataset_id, len(df), columns)
+
+    def meta(self, dataset_id):
+        try:
+            with open(os.path.join(self._dir(dataset_id), "meta.json")) as f:
+                return json.load(f)
+        except (KeyError, FileNotFoundError):
+            return None
+
+    def open(self, dataset_id, columns=None):
+        """
+        Reopen a stored dataset as a DataFrame backed by memory-mapped columns,
+        or return None if it does not exist (expired, evicted or never uploaded).
+        Writes go to private copy-on-write pages and never reach the stored files.
+        """
+        meta = self.meta(dataset_id)
+        if meta is None:
+            return None
+        base = self._dir(dataset_id)
+
+        data = {}
+        for entry in meta["columns"]:
+            if columns is not None and entry["name"] not in columns:
+                continue
+            values = np.load(os.path.join(base, entry["file"]), mmap_mode="c", allow_pickle=False)
+            if entry["kind"] == "category":
+                # codes of -1 mark missing values, which Categorical maps back to NaN
+                values = pd.Categorical.from_codes(values, categories=entry["categories"])
+            data[entry["name"]] = values
+        return pd.DataFrame(data, copy=False)
+
+    def touch(self, dataset_id):
+        """Mark a dataset as recently used so age-based eviction keeps it."""
+        os.utime(self._dir(dataset_id))
+
+    def delete(self, dataset_id):
+        shutil.rmtree(self._dir(dataset_id), ignore_errors=True)
+
+    def _entries(self):
+        if not os.path.isdir(self.root):
+            return []
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.endswith(".tmp") or not os.path.isdir(path):
+                continue
+            size = sum(e.stat().st_size for e in os.scandir(path) if e.is_file())
+            entries.append((os.path.getmtime(path), size, name))
+        return sorted(entries)
+
+    def evict(self, keep=None):
+        """Drop datasets older than ``max_age_seconds``, then the oldest ones until under ``max_bytes``."""
+        entries = self._entries()
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, name in entries:
+            if name == keep:
+                continue
+            if now - mtime > self.max_age_seconds or total > self.max_bytes:
+                self.delete(name)
+                total -= size
+
+
+datasets = DatasetStore()
@@ -0,0 +1,101 @@
+import weakref
+
+import numpy as np
+
+
+_tree_tables = weakref.WeakKeyDictionary()
+
+
+def encoded_columns(bundle):
+    """Feature names in the column order of the encoded model input."""
+    if "numeric_features" in bundle:
+        return list(bundle["numeric_features"]) + list(bundle["categorical_features"])
+    return list(bundle["features"])
+
+
+def _path_table(tree, n_features, weight):
+    """
+    Sparse (nodes x features) matrix holding, for every non-root node, the
+    change in predicted value from its parent, filed under the parent's split
+    feature. Summing the rows on a sample's decision path gives its per-feature
+    contributions (the Saabas approximation of SHAP values).
+    """
+    from scipy import sparse
+
+    t = tree.tree_
+    value = t.value[:, 0, 0]
+    parent = np.full(t.node_count, -1)
+    for children in (t.children_left, t.children_right):
+        has_child = children >= 0
+        parent[children[has_child]] = np.nonzero(has_child)[0]
+    nodes = np.nonzero(parent >= 0)[0]
+    delta = (value[nodes] - value[parent[nodes]]) * weight
+    return sparse.csr_matrix((delta, (nodes, t.feature[parent[nodes]])), shape=(t.node_count, n_features))
+
+
+def _tree_explainer(model, n_features):
+    """(trees, stacked path table, baseline) for a tree model, built once per model."""
+    cached = _tree_tables.get(model)
+    if cached is not None:
+        return cached
+
+    offset = 0.0
+    if hasattr(model, "tree_"):
+        trees, weight = [model], 1.0
+    elif hasattr(model, "learning_rate"):
+        # gradient boosting: init estimate + learning_rate * sum of trees
+        trees, weight = list(np.ravel(model.estimators_)), model.learning_rate
+        if model.init_ != "zero":
+            offset = float(model.init_.predict(np.zeros((1, n_features)))[0])
+    else:
+        # bagged forests average their trees
+        trees = list(model.estimators_)
+        weight = 1.0 / len(trees)
+    baseline = offset + weight * sum(t.tree_.value[0, 0, 0] for t in trees)
+
+    from scipy import sparse
+
+    table = sparse.vstack([_path_table(t, n_features, weight) for t in trees]).tocsr()
+    cached = _tree_tables[model] = (trees, table, float(baseline))
+    return cached
+
+
+def contributions(bundle, X):
+    """
+    Per-feature contributions to each prediction for the encoded matrix ``X``:
+    ``(baseline, C)`` where row ``i`` of ``C`` plus ``baseline`` sums to the
+    prediction for row ``i``.
+
+    Linear models: ``C = X * coef`` (one broadcasted multiply for the whole
+    batch, baseline is the intercept). Tree models: the Saabas path
+    attribution, one sparse decision-path product for the whole batch. Other
+    models return ``(None, None)``.
+    """
+    model = bundle["model"]
+    X = np.asarray(X, dtype=np.float64)
+
+    if hasattr(model, "coef_"):
+        return float(np.ravel(model.intercept_)[0]), X * np.ravel(model.coef_)
+
+    if hasattr(model, "tree_") or hasattr(np.ravel(getattr(model, "estimators_", [None]))[0], "tree_"):
+        # scipy only here: linear models, compact ones included, need NumPy alone
+        from scipy import sparse
+
+        trees, table, baseline = _tree_explainer(model, X.shape[1])
+        X32 = X.astype(np.float32)
+        paths = sparse.hstack([t.decision_path(X32) for t in trees]).tocsr()
+        return baseline, np.asarray((paths @ table).todense())
+
+    return None, None
+
+
+def explain_rows(bundle, X):
+    """
+    ``(baseline, [ {feature: contribution} per row ])`` with contributions
+    rounded for display; ``(None, None)`` if the model cannot be explained.
+    """
+    baseline, C = contributions(bundle, X)
+    if C is None:
+        return None, None
+    names = encoded_columns(bundle)
+    return round(baseline, 4), [dict(zip(names, np.round(row, 4).tolist())) for row in C]
@@ -0,0 +1,148 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+from educationmodel.ml import engines as model_engines
+from educationmodel.ml import pipeline
+
+
+INCREMENTAL_ENGINES = ("linear", "ridge")
+
+
+def _raw_matrix(df, numeric, categorical, means, categories, fill):
+    """
+    ``[1, numeric..., category codes...]`` per row, before min-max scaling, and
+    the per-category counts of the observed (non-missing) values. Missing
+    numbers take ``means``, missing categories their ``fill`` code. Raises
+    ValueError for categories the model has never seen.
+    """
+    frame = pipeline.prepare_frame(df, numeric, categorical)
+    Z = np.empty((len(frame), 1 + len(numeric) + len(categorical)), dtype=np.float64)
+    Z[:, 0] = 1.0
+    if numeric:
+        block = frame[numeric].to_numpy(dtype=np.float64)
+        Z[:, 1:1 + len(numeric)] = np.where(np.isnan(block), np.asarray(means), block)
+    counts = {}
+    for j, f in enumerate(categorical, start=1 + len(numeric)):
+        col = frame[f]
+        missing = col.isna().to_numpy()
+        codes = pd.Categorical(col.astype(str), categories=categories[f]).codes
+        unseen = sorted(set(col[(codes == -1) & ~missing].astype(str)))
+        if unseen:
+            raise ValueError(
+                f"'{f}' has values the model has not seen ({', '.join(unseen[:5])}); run a full training instead.")
+        counts[f] = np.bincount(codes[~missing], minlength=len(categories[f])).tolist()
+        Z[:, j] = np.where(missing, fill[f], codes)
+    return Z, counts
+
+
+def initial_stats(preprocessor, df, y, numeric, categorical):
+    """
+    Sufficient statistics of a freshly fitted training set: ZᵀZ and Zᵀy over the
+    unscaled design matrix ``Z``, plus per-column counts, sums, min/max and
+    category counts to keep the preprocessor's imputation and scaling current.
+    """
+    tables = pipeline.lookup_tables(preprocessor, numeric, categorical)
+    categories = {f: tables["categorical"][f]["categories"] for f in categorical}
+    fill = {f: tables["categorical"][f]["fill"] for f in categorical}
+    stats = {
+        "n": 0,
+        "ztz": np.zeros((1 + len(numeric) + len(categorical),) * 2),
+        "zty": np.zeros(1 + len(numeric) + len(categorical)),
+        "count": np.zeros(len(numeric)),
+        "sum": np.zeros(len(numeric)),
+        "min": np.full(len(numeric), np.inf),
+        "max": np.full(len(numeric), -np.inf),
+        "categories": categories,
+        "category_counts": {f: [0] * len(categories[f]) for f in categorical},
+    }
+    means = tables["numeric"]["mean"] if numeric else []
+    return _accumulate(stats, df, y, numeric, categorical, means, fill)
+
+
+def _accumulate(stats, df, y, numeric, categorical, means, fill):
+    y = np.asarray(y, dtype=np.float64)
+    Z, counts = _raw_matrix(df, numeric, categorical, means, stats["categories"], fill)
+    stats["n"] += len(y)
+    stats["ztz"] += Z.T @ Z
+    stats["zty"] += Z.T @ y
+    if numeric:
+        observed = pipeline.prepare_frame(df, numeric, []).to_numpy(dtype=np.float64)
+        present = ~np.isnan(observed)
+        stats["count"] += present.sum(axis=0)
+        stats["sum"] += np.where(present, observed, 0.0).sum(axis=0)
+        stats["min"] = np.fmin(stats["min"], np.nanmin(observed, axis=0, initial=np.inf))
+        stats["max"] = np.fmax(stats["max"], np.nanmax(observed, axis=0, initial=-np.inf))
+    for f in categorical:
+        stats["category_counts"][f] = [a + b for a, b in zip(stats["category_counts"][f], counts[f])]
+    return stats
+
+
+def update(bundle, df, y):
+    """
+    Fold new rows into a copy of ``bundle["stats"]``. Cost is one pass over the
+    new rows plus a (features x features) update, independent of how many rows
+    the model has already seen.
+    """
+    stats = copy.deepcopy(bundle["stats"])
+    tables = bundle["encoders"]
+    fill = {f: tables["categorical"][f]["fill"] for f in bundle["categorical_features"]}
+    means = tables["numeric"]["mean"] if bundle["numeric_features"] else []
+    return _accumulate(stats, df, y, bundle["numeric_features"], bundle["categorical_features"], means, fill)
+
+
+def refresh_preprocessor(preprocessor, stats, numeric, categorical):
+    """A copy of the fitted preprocessor with imputation and scaling taken from ``stats``."""
+    preprocessor = copy.deepcopy(preprocessor)
+    if numeric:
+        num = preprocessor.named_transformers_["num"]
+        means = np.where(stats["count"] > 0, stats["sum"] / np.maximum(stats["count"], 1), 0.0)
+        num.named_steps["impute"].statistics_ = means
+        scaler = num.named_steps["scale"]
+        lo, hi = scaler.feature_range
+        data_range = stats["max"] - stats["min"]
+        scaler.data_min_, scaler.data_max_, scaler.data_range_ = stats["min"], stats["max"], data_range
+        scaler.scale_ = (hi - lo) / np.where(data_range == 0, 1.0, data_range)
+        scaler.min_ = lo - stats["min"] * scaler.scale_
+        scaler.n_samples_seen_ = stats["n"]
+    if categorical:
+        imputer = preprocessor.named_transformers_["cat"].named_steps["impute"]
+        # most frequent category, ties broken by sort order as SimpleImputer does
+        imputer.statistics_ = np.array([
+            stats["categories"][f][int(np.argmax(stats["category_counts"][f]))] for f in categorical
+        ], dtype=object)
+    return preprocessor
+
+
+def solve(engine, params, stats, preprocessor, numeric, categorical):
+    """
+    Fit ``engine`` (linear or ridge) from ``stats`` alone. The normal equations
+    are mapped into the min-max scaled space of ``preprocessor`` (an affine map
+    of ZᵀZ and Zᵀy), so the coefficients equal those of a full refit.
+    """
+    if engine not in INCREMENTAL_ENGINES:
+        raise ValueError("Incremental training needs a linear or ridge model.")
+
+    k = 1 + len(numeric) + len(categorical)
+    A = np.eye(k)
+    if numeric:
+        scaler = preprocessor.named_transformers_["num"].named_steps["scale"]
+        idx = np.arange(1, 1 + len(numeric))
+        A[idx, idx] = scaler.scale_
+        A[0, idx] = scaler.min_
+    gram = A.T @ stats["ztz"] @ A
+    rhs = A.T @ stats["zty"]
+
+    model = model_engines.make(engine, params)
+    if engine == "ridge":
+        penalty = np.full(k, float(model.alpha))
+        penalty[0] = 0.0  # the intercept is not penalized
+        beta = np.linalg.solve(gram + np.diag(penalty), rhs)
+    else:
+        beta = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+
+    model.coef_ = beta[1:]
+    model.intercept_ = float(beta[0])
+    model.n_features_in_ = k - 1
+    return model
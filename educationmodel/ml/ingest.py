@@ -0,0 +1,195 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from educationmodel.ml.datastore import datasets
+
+
+CHUNK_ROWS = 50_000
+
+
+def iter_chunks(path, chunksize=CHUNK_ROWS):
+    """Yield DataFrames of at most ``chunksize`` rows from a CSV or Excel file."""
+    if path.endswith(".csv"):
+        yield from pd.read_csv(path, chunksize=chunksize)
+    elif path.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = [str(h) for h in next(rows, ())]
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= chunksize:
+                    yield pd.DataFrame(batch, columns=header)
+                    batch = []
+            if batch or not header:
+                yield pd.DataFrame(batch, columns=header)
+        finally:
+            wb.close()
+    elif path.endswith(".xls"):
+        # legacy .xls has no streaming reader; read once and slice
+        df = pd.read_excel(path)
+        for start in range(0, max(len(df), 1), chunksize):
+            yield df.iloc[start:start + chunksize]
+    else:
+        raise ValueError("Only CSV and Excel files are supported.")
+
+
+class _NumericColumn:
+    def __init__(self, name, spool):
+        self.name = name
+        self.spool = spool
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.all_int = True
+
+    def add(self, series, fh):
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+        present = values[~np.isnan(values)]
+        if present.size:
+            self.count += present.size
+            self.total += float(present.sum())
+            self.min = min(self.min, float(present.min()))
+            self.max = max(self.max, float(present.max()))
+            self.all_int = self.all_int and bool(np.all(present == np.floor(present)))
+        fh.write(values.tobytes())
+
+    def stats(self):
+        if not self.count:
+            return {"count": 0, "mean": None, "min": None, "max": None}
+        return {"count": self.count, "mean": self.total / self.count, "min": self.min, "max": self.max}
+
+    def dtype(self, rows):
+        if self.all_int and self.count == rows:
+            for dt in (np.int8, np.int16, np.int32):
+                info = np.iinfo(dt)
+                if info.min <= self.min and self.max <= info.max:
+                    return dt
+            return np.int64
+        return np.float32
+
+    def finalize(self, rows, out_path, block):
+        src = np.memmap(self.spool, dtype=np.float64, mode="r", shape=(rows,))
+        dtype = self.dtype(rows)
+        dst = np.lib.format.open_memmap(out_path, mode="w+", dtype=dtype, shape=(rows,))
+        for start in range(0, rows, block):
+            dst[start:start + block] = src[start:start + block].astype(dtype)
+        dst.flush()
+        del src, dst
+        return {"kind": "numeric", "dtype": np.dtype(dtype).name}
+
+
+class _CategoryColumn:
+    def __init__(self, name, spool):
+        self.name = name
+        self.spool = spool
+        self.codes = {}
+        self.counts = []
+
+    def add(self, series, fh):
+        local, uniques = pd.factorize(series.astype(object).where(series.notna(), None))
+        lookup = np.empty(len(uniques) + 1, dtype=np.int32)
+        lookup[-1] = -1  # factorize marks missing values as -1
+        for i, value in enumerate(uniques):
+            value = str(value)
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.counts)
+                self.counts.append(0)
+            lookup[i] = code
+        codes = lookup[local]
+        for code, n in zip(*np.unique(codes[codes >= 0], return_counts=True)):
+            self.counts[code] += int(n)
+        fh.write(codes.tobytes())
+
+    def mode(self):
+        if not self.counts:
+            return None
+        # pandas' mode() breaks ties by sort order; do the same
+        return min(self.codes, key=lambda v: (-self.counts[self.codes[v]], v))
+
+    def stats(self):
+        return {"mode": self.mode(), "counts": {v: self.counts[c] for v, c in self.codes.items()}}
+
+    def finalize(self, rows, out_path, block):
+        categories = sorted(self.codes)
+        remap = np.empty(len(categories) + 1, dtype=np.int32)
+        for new_code, value in enumerate(categories):
+            remap[self.codes[value]] = new_code
+        remap[-1] = -1  # missing stays missing
+
+        dtype = np.int8 if len(categories) < 127 else np.int16 if len(categories) < 32767 else np.int32
+        src = np.memmap(self.spool, dtype=np.int32, mode="r", shape=(rows,))
+        dst = np.lib.format.open_memmap(out_path, mode="w+", dtype=dtype, shape=(rows,))
+        for start in range(0, rows, block):
+            dst[start:start + block] = remap[src[start:start + block]]
+        dst.flush()
+        del src, dst
+        return {"kind": "category", "dtype": np.dtype(dtype).name, "categories": categories}
+
+
+def ingest(path, chunksize=CHUNK_ROWS, store=datasets):
+    """
+    Stream ``path`` into the dataset store in one pass over the file.
+
+    Each chunk is appended to per-column spool files while running counts,
+    means, min/max and category counts are accumulated; they are stored in the
+    dataset's meta and seed its profile summaries. A final column-at-a-time pass
+    over the spools writes compact columns: int8..int32 or float32 for numbers
+    and small-int category codes for text. Missing values are kept (NaN / code
+    -1) for the training preprocessor to impute. Peak memory is one chunk, not
+    the whole file.
+
+    Returns the new dataset ID.
+    """
+    dataset_id, tmp_dir = store.begin()
+    try:
+        rows, columns = _spool(path, chunksize, tmp_dir)
+
+        entries = []
+        stats = {}
+        for i, column in enumerate(columns):
+            entry = {"name": column.name, "file": f"c{i}.npy"}
+            entry.update(column.finalize(rows, os.path.join(tmp_dir, entry["file"]), chunksize))
+            os.remove(column.spool)
+            entries.append(entry)
+            stats[column.name] = column.stats()
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return store.commit(dataset_id, rows, entries, stats=stats)
+
+
+def _spool(path, chunksize, tmp_dir):
+    columns = None
+    handles = []
+    rows = 0
+    try:
+        for chunk in iter_chunks(path, chunksize):
+            if columns is None:
+                columns = []
+                for i, col in enumerate(chunk.columns):
+                    spool = os.path.join(tmp_dir, f"c{i}.spool")
+                    is_numeric = pd.api.types.is_numeric_dtype(chunk[col].dtype) and \
+                        not pd.api.types.is_bool_dtype(chunk[col].dtype)
+                    kind = _NumericColumn if is_numeric else _CategoryColumn
+                    columns.append(kind(str(col), spool))
+                    handles.append(open(spool, "wb"))
+            for column, fh, col in zip(columns, handles, chunk.columns):
+                column.add(chunk[col], fh)
+            rows += len(chunk)
+    finally:
+        for fh in handles:
+            fh.close()
+
+    if not columns:
+        raise ValueError("The uploaded file is empty.")
+    return rows, columns
@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from educationmodel.ml.training import train
+from educationmodel.models import TrainingJob
+
+
+logger = logging.getLogger(__name__)
+
+_workers = []
+_workers_lock = threading.Lock()
+_wake = threading.Event()
+_running = set()  # ids of the jobs this process is running, kept alive by the heartbeat
+
+
+def _poll_seconds():
+    return getattr(settings, "TRAINING_POLL_SECONDS", 2.0)
+
+
+def _stale_seconds():
+    return getattr(settings, "TRAINING_STALE_SECONDS", 120)
+
+
+def start_workers():
+    """
+    Start this process's training threads (``TRAINING_WORKERS``) and its
+    heartbeat, once. The threads take queued jobs from the table, so jobs
+    enqueued by any worker, or left queued by one that has since restarted,
+    are picked up by whichever process polls first.
+    """
+    with _workers_lock:
+        if _workers:
+            return
+        for i in range(getattr(settings, "TRAINING_WORKERS", 2)):
+            _workers.append(threading.Thread(target=_work, name=f"training-{i}", daemon=True))
+        _workers.append(threading.Thread(target=_heartbeat, name="training-heartbeat", daemon=True))
+        for thread in _workers:
+            thread.start()
+
+
+def enqueue(dataset_id, features, target, **options):
+    """
+    Record a queued job and wake the local training threads. ``options`` are
+    passed on to ``train`` (e.g. ``engines``). Returns the job.
+    """
+    job = TrainingJob.objects.create(dataset_id=dataset_id, features=features, target=target, options=options)
+    start_workers()
+    _wake.set()
+    return job
+
+
+def fail_stale_jobs():
+    """
+    Mark ``running`` jobs whose heartbeat is older than ``TRAINING_STALE_SECONDS``
+    as failed: the process running them exited (deploy, crash, recycled worker).
+    """
+    cutoff = timezone.now() - timedelta(seconds=_stale_seconds())
+    stale = Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+    jobs = TrainingJob.objects.filter(stale, status="running")
+    # a read first: on SQLite an UPDATE takes the write lock even when nothing matches
+    if not jobs.exists():
+        return 0
+    return jobs.update(
+        status="failed", error="The worker running this job stopped. Please start the training again.",
+        finished_at=timezone.now())
+
+
+def _claim_next():
+    """Atomically move the oldest queued job to ``running``; its id, or None if there is none."""
+    for job_id in TrainingJob.objects.filter(status="queued").order_by("id").values_list("id", flat=True)[:5]:
+        now = timezone.now()
+        # the conditional update makes sure only one thread in one process wins each job
+        if TrainingJob.objects.filter(id=job_id, status="queued").update(
+                status="running", started_at=now, heartbeat_at=now):
+            return job_id
+    return None
+
+
+def _work():
+    while True:
+        close_old_connections()
+        try:
+            job_id = _claim_next()
+        except Exception:
+            logger.exception("Polling for training jobs failed")
+            job_id = None
+        if job_id is None:
+            _wake.wait(_poll_seconds())
+            _wake.clear()
+            continue
+        run_job(job_id)
+
+
+def _heartbeat():
+    # also sweeps for jobs orphaned by other processes, at the same slow pace
+    while True:
+        time.sleep(_stale_seconds() / 4)
+        with _workers_lock:
+            running = list(_running)
+        close_old_connections()
+        try:
+            if running:
+                TrainingJob.objects.filter(id__in=running, status="running").update(heartbeat_at=timezone.now())
+            fail_stale_jobs()
+        except Exception:
+            logger.exception("Training job heartbeat failed")
+
+
+def run_job(job_id):
+    """Run one claimed job, recording stage, progress and timings on its row."""
+    with _workers_lock:
+        _running.add(job_id)
+    try:
+        job = TrainingJob.objects.get(id=job_id)
+
+        def report(stage, percent, timings):
+            TrainingJob.objects.filter(id=job_id).update(
+                stage=stage, progress=percent, timings=dict(timings), heartbeat_at=timezone.now())
+
+        try:
+            df_info = train(job.dataset_id, job.features, job.target, report=report, **job.options)
+        except Exception as e:
+            logger.exception("Training job %s failed", job_id)
+            TrainingJob.objects.filter(id=job_id).update(
+                status="failed", error=str(e), finished_at=timezone.now())
+            return
+
+        TrainingJob.objects.filter(id=job_id).update(
+            status="done", stage="", progress=100, timings=df_info["timings"],
+            result=df_info, finished_at=timezone.now())
+    finally:
+        with _workers_lock:
+            _running.discard(job_id)
+        close_old_connections()
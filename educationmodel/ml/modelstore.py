@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+
+
+LEGACY_MODEL_FILE = "latest_model.pkl"
+
+
+def _root():
+    return str(getattr(settings, "MODEL_ROOT", "models"))
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class ModelStore:
+    """
+    Immutable, versioned model bundles plus one small pointer file.
+
+    Every training run writes ``versions/<version>.pkl`` and a ``.json`` sidecar
+    with its metadata; linear models also get a compact ``.npz`` copy that
+    loads without sklearn (``MODEL_COMPACT_EXPORT``, see ``compact``).
+    ``CURRENT.json`` names the active version (and an optional A/B candidate
+    with its traffic share); it is replaced atomically, so activation and
+    rollback never touch the pickles themselves.
+
+    joblib (and with it NumPy) is only imported to read or write a bundle, so
+    listing versions and moving the pointer stay cheap for web workers.
+    """
+
+    def __init__(self, root=None):
+        self._root = root
+
+    @property
+    def root(self):
+        return self._root or _root()
+
+    @property
+    def pointer_path(self):
+        return os.path.join(self.root, "CURRENT.json")
+
+    @property
+    def legacy_path(self):
+        return os.path.join(self.root, LEGACY_MODEL_FILE)
+
+    def _version_path(self, version, ext):
+        if not version or os.sep in version or version.startswith("."):
+            raise KeyError(version)
+        return os.path.join(self.root, "versions", f"{version}.{ext}")
+
+    def publish(self, bundle, meta, activate=True):
+        """Write a new version and (by default) make it the active one. Returns the version ID."""
+        import joblib
+        from educationmodel.ml import compact
+
+        os.makedirs(os.path.join(self.root, "versions"), exist_ok=True)
+        tmp_path = os.path.join(self.root, "versions", f".{os.getpid()}.{threading.get_ident()}.tmp")
+        joblib.dump(bundle, tmp_path)
+
+        digest = hashlib.sha256()
+        with open(tmp_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sha = digest.hexdigest()
+
+        created = time.time()
+        version = time.strftime("%Y%m%d-%H%M%S", time.gmtime(created)) + "-" + sha[:8]
+        os.replace(tmp_path, self._version_path(version, "pkl"))
+
+        has_compact = getattr(settings, "MODEL_COMPACT_EXPORT", True) and compact.supports(bundle)
+        if has_compact:
+            with open(tmp_path, "wb") as f:
+                compact.export({**bundle, "version": version}, f)
+            os.replace(tmp_path, self._version_path(version, "npz"))
+        _write_json(self._version_path(version, "json"), {
+            **meta, "version": version, "sha256": sha, "created": created, "compact": has_compact,
+        })
+
+        if activate:
+            self.activate(version)
+        return version
+
+    def load(self, version):
+        import joblib
+
+        bundle = joblib.load(self._version_path(version, "pkl"))
+        bundle["version"] = version
+        return bundle
+
+    def compact_path(self, version):
+        """Path of the compact ``.npz`` export of ``version``, or None if it has none."""
+        path = self._version_path(version, "npz")
+        return path if os.path.exists(path) else None
+
+    def export_compact(self, version):
+        """Write the compact export of an already stored ``version``. Returns its path."""
+        from educationmodel.ml import compact
+
+        path = self._version_path(version, "npz")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            compact.export(self.load(version), f)
+        os.replace(tmp_path, path)
+        _write_json(self._version_path(version, "json"), {**self.meta(version), "compact": True})
+        return path
+
+    def meta(self, version):
+        try:
+            with open(self._version_path(version, "json")) as f:
+                return json.load(f)
+        except (KeyError, FileNotFoundError):
+            return None
+
+    def versions(self):
+        """Metadata of every stored version, newest first."""
+        directory = os.path.join(self.root, "versions")
+        if not os.path.isdir(directory):
+            return []
+        metas = [self.meta(name[:-5]) for name in os.listdir(directory) if name.endswith(".json")]
+        return sorted((m for m in metas if m), key=lambda m: m["created"], reverse=True)
+
+    def pointer(self):
+        try:
+            with open(self.pointer_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _set_pointer(self, **changes):
+        pointer = self.pointer() or {"active": None, "previous": None, "candidate": None, "candidate_share": 0.0}
+        pointer.update(changes, updated=time.time())
+        _write_json(self.pointer_path, pointer)
+        return pointer
+
+    def activate(self, version):
+        if self.meta(version) is None:
+            raise KeyError(version)
+        current = self.pointer() or {}
+        if current.get("active") == version:
+            return current
+        return self._set_pointer(active=version, previous=current.get("active"), candidate=None, candidate_share=0.0)
+
+    def rollback(self):
+        """Swap back to the previously active version."""
+        current = self.pointer() or {}
+        previous = current.get("previous")
+        if not previous or self.meta(previous) is None:
+            raise LookupError("There is no previous model version to roll back to.")
+        return self.activate(previous)
+
+    def set_split(self, candidate, share):
+        """Route ``share`` (0..1) of prediction traffic to ``candidate``; ``None`` stops the split."""
+        if candidate is not None and self.meta(candidate) is None:
+            raise KeyError(candidate)
+        share = min(max(float(share), 0.0), 1.0) if candidate else 0.0
+        return self._set_pointer(candidate=candidate, candidate_share=share)
+
+
+models = ModelStore()
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MinMaxScaler, OrdinalEncoder
+
+
+def split_features(df, features):
+    """Return ``(numeric, categorical)`` feature lists based on the stored dtypes."""
+    numeric = [f for f in features if pd.api.types.is_numeric_dtype(df[f].dtype)
+               and not isinstance(df[f].dtype, pd.CategoricalDtype)]
+    categorical = [f for f in features if f not in numeric]
+    return numeric, categorical
+
+
+def prepare_frame(df, numeric, categorical):
+    """
+    Coerce raw input (stored columns, form fields or CSV rows) to the dtypes the
+    preprocessor was fitted on: floats for numeric features, strings for the rest.
+    Missing columns become missing values and are imputed like any other gap.
+    """
+    data = {}
+    for f in numeric:
+        col = df[f] if f in df else pd.Series(np.nan, index=df.index)
+        data[f] = pd.to_numeric(col, errors="coerce").astype(np.float64)
+    for f in categorical:
+        col = df[f] if f in df else pd.Series(None, index=df.index, dtype=object)
+        col = col.astype(object)
+        data[f] = col.where(col.notna() & (col != ""), np.nan).astype(object)
+    return pd.DataFrame(data, index=df.index, columns=numeric + categorical)
+
+
+def build_preprocessor(numeric, categorical):
+    """
+    Imputation, min-max scaling and ordinal encoding as one fitted transformer.
+    Fitted once per training run and saved in the model bundle, so prediction
+    applies exactly the statistics the model was trained with.
+    """
+    return ColumnTransformer([
+        ("num", Pipeline([
+            ("impute", SimpleImputer(strategy="mean")),
+            ("scale", MinMaxScaler()),
+        ]), numeric),
+        ("cat", Pipeline([
+            ("impute", SimpleImputer(strategy="most_frequent")),
+            ("encode", OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1)),
+        ]), categorical),
+    ])
+
+
+def lookup_tables(preprocessor, numeric, categorical):
+    """
+    Flatten a fitted preprocessor into plain arrays: per numeric feature the
+    imputation mean and the scaler's ``scale_``/``min_``, per categorical
+    feature its ordered categories and the imputed (most frequent) code.
+    """
+    tables = {"numeric": {"mean": [], "scale": [], "offset": []}, "categorical": {}}
+    if numeric:
+        num = preprocessor.named_transformers_["num"]
+        tables["numeric"] = {
+            "mean": num.named_steps["impute"].statistics_.astype(float).tolist(),
+            "scale": num.named_steps["scale"].scale_.tolist(),
+            "offset": num.named_steps["scale"].min_.tolist(),
+        }
+    if categorical:
+        cat = preprocessor.named_transformers_["cat"]
+        fill_values = cat.named_steps["impute"].statistics_
+        for f, categories, fill in zip(categorical, cat.named_steps["encode"].categories_, fill_values):
+            categories = [str(c) for c in categories]
+            tables["categorical"][f] = {"categories": categories, "fill": categories.index(str(fill))}
+    return tables
+
+
+def transform(bundle, df):
+    """
+    Model input matrix for raw ``df``. Uses the bundle's precomputed lookup
+    tables: numeric columns are imputed and scaled as whole arrays, text
+    columns are mapped to their trained codes with one hash lookup per column
+    (unknown values -> -1, as during training).
+    """
+    tables = bundle.get("encoders")
+    if tables is None:
+        frame = prepare_frame(df, bundle["numeric_features"], bundle["categorical_features"])
+        return bundle["preprocessor"].transform(frame)
+
+    numeric = bundle["numeric_features"]
+    categorical = bundle["categorical_features"]
+    X = np.empty((len(df), len(numeric) + len(categorical)), dtype=np.float64)
+
+    if numeric:
+        num = tables["numeric"]
+        block = prepare_frame(df, numeric, []).to_numpy(dtype=np.float64)
+        block = np.where(np.isnan(block), np.asarray(num["mean"]), block)
+        X[:, :len(numeric)] = block * np.asarray(num["scale"]) + np.asarray(num["offset"])
+
+    for j, f in enumerate(categorical, start=len(numeric)):
+        table = tables["categorical"][f]
+        col = df[f] if f in df else pd.Series(None, index=df.index, dtype=object)
+        missing = (col.isna() | (col.astype(str) == "")).to_numpy()
+        codes = pd.Categorical(col.astype(str), categories=table["categories"]).codes.astype(np.float64)
+        codes[missing] = table["fill"]
+        X[:, j] = codes
+    return X
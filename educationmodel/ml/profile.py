@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+
+import pandas as pd
+from django.conf import settings
+
+from educationmodel.ml.datastore import datasets
+
+
+PROFILE_VERSION = 1
+
+TABLE_CLASSES = "min-w-full border border-gray-300 rounded-lg text-sm"
+TBODY_CLASSES = "divide-y divide-gray-200"
+
+
+def to_html(frame, **kwargs):
+    return frame.to_html(classes=f"dataframe {TABLE_CLASSES}", border=0, **kwargs) \
+        .replace("<tbody>", f"<tbody class='{TBODY_CLASSES}'>")
+
+
+def numeric_view(df):
+    """Stored category columns as their (sorted) integer codes, missing -> NaN."""
+    return df.apply(lambda c: c.cat.codes.where(c.cat.codes >= 0) if isinstance(c.dtype, pd.CategoricalDtype) else c)
+
+
+def _root():
+    return str(getattr(settings, "PROFILE_ROOT", "profiles"))
+
+
+def _path(content_hash):
+    return os.path.join(_root(), f"{content_hash}.v{PROFILE_VERSION}.json")
+
+
+def _summary_from_stats(entry, stats, rows):
+    # what ingest accumulated while reading the file; None for datasets stored without it
+    if entry["kind"] == "numeric" and stats and "count" in stats:
+        mean = stats["mean"]
+        return {"missing": rows - stats["count"], "mean": round(mean, 4) if mean is not None else None,
+                "min": stats["min"], "max": stats["max"]}
+    if entry["kind"] != "numeric" and stats and "counts" in stats:
+        counts = stats["counts"]
+        return {"missing": rows - sum(counts.values()), "distinct": sum(1 for n in counts.values() if n),
+                "top": stats["mode"] or ""}
+    return None
+
+
+def _summary_from_column(entry, col):
+    row = {"missing": int(col.isna().sum())}
+    if entry["kind"] == "numeric":
+        row.update({"mean": round(float(col.mean()), 4), "min": float(col.min()), "max": float(col.max())})
+    else:
+        counts = col.value_counts()
+        row.update({"distinct": int(len(counts)), "top": str(counts.index[0]) if len(counts) else ""})
+    return row
+
+
+def compute_profile(df, meta):
+    """Correlations and per-column summaries for one dataset version."""
+    corr = numeric_view(df).corr()
+
+    summary = []
+    stats = meta.get("stats") or {}
+    for entry in meta["columns"]:
+        row = {"column": entry["name"], "type": entry.get("dtype", entry["kind"])}
+        row.update(_summary_from_stats(entry, stats.get(entry["name"]), meta["rows"]) or
+                   _summary_from_column(entry, df[entry["name"]]))
+        summary.append(row)
+    summary = pd.DataFrame(summary)
+
+    return {
+        "rows": int(df.shape[0]),
+        "cols": int(df.shape[1]),
+        "correlation": json.loads(corr.to_json()),
+        "correlations_html": to_html(corr),
+        "summary_html": to_html(summary.fillna(""), index=False),
+    }
+
+
+def get_profile(dataset_id, df=None):
+    """
+    Return the cached profile for ``dataset_id``, computing and storing it on the
+    first request. Profiles are keyed by the dataset's content hash, so re-uploads
+    of the same data and repeated training runs reuse one computation.
+    """
+    meta = datasets.meta(dataset_id)
+    if meta is None:
+        return None
+
+    path = _path(meta["content_hash"])
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+
+    if df is None:
+        df = datasets.open(dataset_id)
+    profile = compute_profile(df, meta)
+
+    os.makedirs(_root(), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(profile, f)
+    os.replace(tmp_path, path)
+    return profile
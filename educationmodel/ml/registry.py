@@ -0,0 +1,154 @@
+import hashlib
+import os
+import random
+import threading
+import time
+
+from django.conf import settings
+
+from educationmodel.ml.cache import predictions
+from educationmodel.ml.modelstore import models
+
+
+LEGACY_VERSION = "legacy"
+
+
+class ModelRegistry:
+    """
+    Process-wide holder for the active model bundle(s).
+
+    Bundles are loaded once per worker and kept in memory. Every lookup only
+    stats the store's pointer file (or the legacy ``latest_model.pkl`` when no
+    versioned model exists yet); when its mtime/size stamp changes the pointer
+    is re-read and any newly referenced version is loaded and swapped in as a
+    single reference assignment, so readers always see either the old or the
+    new state, never a mix. Versions already in memory are never reloaded.
+    Each swap also drops prediction-cache entries of versions no longer served.
+
+    Versions with a compact export are served from it (``MODEL_SERVE_COMPACT``):
+    nothing is unpickled and sklearn is never imported for them, see
+    ``compact.CompactModel.as_bundle``. Other engines load the full bundle.
+    """
+
+    def __init__(self, store=models, cache=predictions):
+        self.store = store
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._entry = None  # (stamp, pointer, {version: bundle})
+        self.load_count = 0
+        self.last_load_seconds = 0.0
+        self.total_load_seconds = 0.0
+        self.last_loaded_at = None
+        self.served = {}
+
+    def _stamp(self):
+        for kind, path in (("pointer", self.store.pointer_path), ("legacy", self.store.legacy_path)):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            return (kind, st.st_mtime_ns, st.st_size)
+        return None
+
+    def _load(self, loader, version):
+        start = time.perf_counter()
+        bundle = loader(version)
+        elapsed = time.perf_counter() - start
+        self.load_count += 1
+        self.last_load_seconds = elapsed
+        self.total_load_seconds += elapsed
+        self.last_loaded_at = time.time()
+        return bundle
+
+    def _load_version(self, version):
+        meta = self.store.meta(version) or {}
+        path = getattr(settings, "MODEL_SERVE_COMPACT", True) and meta.get("compact") and \
+            self.store.compact_path(version)
+        if path:
+            from educationmodel.ml.compact import CompactModel
+            return CompactModel.load(path).as_bundle()
+        return self.store.load(version)
+
+    def _load_legacy(self, version):
+        import joblib
+
+        return joblib.load(self.store.legacy_path)
+
+    def _refresh(self, stamp):
+        previous = self._entry[2] if self._entry else {}
+        if stamp[0] == "legacy":
+            # each rewrite of the file is its own version, so the swap drops
+            # cached predictions of the bundle it replaces
+            version = f"{LEGACY_VERSION}-{stamp[1]}"
+            pointer = {"active": version, "candidate": None, "candidate_share": 0.0}
+            bundle = self._load(self._load_legacy, version)
+            bundle["version"] = version
+            return (stamp, pointer, {version: bundle})
+
+        pointer = self.store.pointer() or {}
+        bundles = {}
+        for version in (pointer.get("active"), pointer.get("candidate")):
+            if version and version not in bundles:
+                bundles[version] = previous.get(version) or self._load(self._load_version, version)
+        return (stamp, pointer, bundles)
+
+    def _current(self):
+        stamp = self._stamp()
+        if stamp is None:
+            return None
+
+        entry = self._entry
+        if entry is not None and entry[0] == stamp:
+            return entry
+
+        with self._lock:
+            if self._entry is None or self._entry[0] != stamp:
+                self._entry = self._refresh(stamp)
+                # cached predictions of versions no longer served are dead weight
+                self.cache.retain(self._entry[2])
+            return self._entry
+
+    def get(self, route_key=None):
+        """
+        Return the bundle to score with, or None if no model has been trained.
+
+        While an A/B split is configured, ``route_key`` (e.g. the student's ID)
+        is hashed to a stable bucket so the same student keeps seeing the same
+        version; without a key the request is routed at random.
+        """
+        entry = self._current()
+        if entry is None:
+            return None
+        _, pointer, bundles = entry
+
+        version = pointer.get("active")
+        candidate = pointer.get("candidate")
+        share = pointer.get("candidate_share") or 0.0
+        if candidate and share > 0:
+            if route_key is None:
+                bucket = random.random()
+            else:
+                bucket = int(hashlib.sha1(str(route_key).encode()).hexdigest()[:8], 16) / 0xFFFFFFFF
+            if bucket < share:
+                version = candidate
+
+        bundle = bundles.get(version)
+        if bundle is not None:
+            self.served[version] = self.served.get(version, 0) + 1
+        return bundle
+
+    def stats(self):
+        entry = self._entry
+        return {
+            "pointer": entry[1] if entry else None,
+            "loaded_versions": sorted(entry[2]) if entry else [],
+            "compact_versions": sorted(v for v, b in entry[2].items() if "compact" in b) if entry else [],
+            "load_count": self.load_count,
+            "last_load_ms": round(self.last_load_seconds * 1000, 3),
+            "avg_load_ms": round(self.total_load_seconds * 1000 / self.load_count, 3) if self.load_count else 0.0,
+            "last_loaded_at": self.last_loaded_at,
+            "served": dict(self.served),
+        }
+
+
+registry = ModelRegistry()
@@ -0,0 +1,49 @@
+import io
+
+import pandas as pd
+
+from educationmodel.ml import pipeline
+from educationmodel.ml.explain import contributions, encoded_columns
+
+
+BATCH_CHUNK_ROWS = 10_000
+
+
+def encode_frame(bundle, df):
+    """Return the model input matrix for ``df`` in the trained feature order."""
+    if "preprocessor" in bundle or "encoders" in bundle:
+        return pipeline.transform(bundle, df)
+    # bundles saved before the fitted preprocessor existed take raw numeric inputs
+    X = df.reindex(columns=bundle["features"])
+    return X.apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy(dtype=float)
+
+
+def predict_frame(bundle, df):
+    """Vectorized prediction over every row of ``df``."""
+    return bundle["model"].predict(encode_frame(bundle, df))
+
+
+def iter_scored_csv(source, bundle, chunksize=BATCH_CHUNK_ROWS, on_scored=None, explain=False):
+    """
+    Stream ``source`` (path or file object) through the model ``chunksize`` rows at a time
+    and yield the rows back as CSV text with a prediction column appended.
+    With ``explain`` a ``Contribution_<feature>`` column per feature follows it,
+    computed for the whole chunk at once.
+    ``on_scored(n)`` is called after each chunk with the number of rows scored.
+    """
+    out_col = "Predicted_" + bundle["target"]
+    first = True
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        X = encode_frame(bundle, chunk)
+        chunk[out_col] = bundle["model"].predict(X)
+        if explain:
+            _, C = contributions(bundle, X)
+            if C is not None:
+                for j, name in enumerate(encoded_columns(bundle)):
+                    chunk["Contribution_" + name] = C[:, j].round(4)
+        if on_scored:
+            on_scored(len(chunk))
+        buf = io.StringIO()
+        chunk.to_csv(buf, header=first, index=False)
+        first = False
+        yield buf.getvalue()
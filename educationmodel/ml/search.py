@@ -0,0 +1,213 @@
+import math
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+from django.conf import settings
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.stats import loguniform, randint
+from sklearn.model_selection import KFold, ParameterGrid, ParameterSampler
+
+from educationmodel.ml import engines as model_engines
+
+
+# name -> (grid for grid/halving search, distributions for randomized search)
+SEARCH_SPACES = {
+    "linear": ({}, {}),
+    "ridge": (
+        {"alpha": [0.01, 0.1, 1.0, 10.0, 100.0]},
+        {"alpha": loguniform(1e-3, 1e3)},
+    ),
+    "lasso": (
+        {"alpha": [0.001, 0.01, 0.1, 1.0]},
+        {"alpha": loguniform(1e-4, 1e1)},
+    ),
+    "gbt": (
+        {"n_estimators": [100, 300], "learning_rate": [0.05, 0.1, 0.2], "max_depth": [2, 3, 4]},
+        {"n_estimators": randint(50, 500), "learning_rate": loguniform(0.01, 0.3), "max_depth": randint(2, 6)},
+    ),
+    "forest": (
+        {"n_estimators": [100, 300], "max_depth": [None, 8, 16], "min_samples_leaf": [1, 5]},
+        {"n_estimators": randint(50, 400), "max_depth": [None, 4, 8, 16, 32], "min_samples_leaf": randint(1, 10)},
+    ),
+}
+SEARCH_MODES = {
+    "grid": "Grid search",
+    "random": "Randomized search",
+    "halving": "Successive halving",
+}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _plain(value):
+    # numpy scalars from the samplers -> JSON-serializable Python values
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def candidates(engines, mode, n_iter=None, seed=0):
+    """
+    ``[(engine, params), ...]`` to evaluate, shuffled so that an early stop or
+    an exhausted budget has still sampled every engine. ``grid`` and
+    ``halving`` enumerate each engine's grid; ``random`` draws ``n_iter``
+    (``TRAINING_SEARCH_CANDIDATES``) settings split across the engines.
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode '{mode}'.")
+    pool = []
+    if mode == "random":
+        n_iter = n_iter or _setting("TRAINING_SEARCH_CANDIDATES", 30)
+        tunable = [e for e in engines if SEARCH_SPACES[e][1]]
+        for name in engines:
+            if name not in tunable:
+                pool.append((name, {}))
+        for i, name in enumerate(tunable):
+            share = n_iter // len(tunable) + (i < n_iter % len(tunable))
+            for params in ParameterSampler(SEARCH_SPACES[name][1], max(share, 1), random_state=seed):
+                pool.append((name, {k: _plain(v) for k, v in params.items()}))
+    else:
+        for name in engines:
+            pool.extend((name, params) for params in ParameterGrid(SEARCH_SPACES[name][0]))
+    order = np.random.RandomState(seed).permutation(len(pool))
+    return [pool[i] for i in order]
+
+
+def _splits(rows, folds, n_rows):
+    # k-fold splits over the first ``n_rows`` of a fixed permutation of the data
+    subset = rows[:n_rows]
+    return [(subset[a], subset[b])
+            for a, b in KFold(n_splits=folds, shuffle=True, random_state=0).split(subset)]
+
+
+def _evaluate(parallel, X, y, pool, splits):
+    """Cross-validate every candidate of ``pool`` in one pass over the process pool."""
+    scores = parallel(
+        delayed(model_engines._fit_fold)(name, params, X, y, train_idx, test_idx)
+        for name, params in pool for train_idx, test_idx in splits
+    )
+    k = len(splits)
+    trials = []
+    for i, (name, params) in enumerate(pool):
+        rows = scores[i * k:(i + 1) * k]
+        trials.append({
+            "engine": name,
+            "label": model_engines.ENGINES[name][0],
+            "params": {**model_engines.ENGINES[name][2], **params},
+            "cv_mae": round(float(np.mean([s[2] for s in rows])), 4),
+            "cv_r2": round(float(np.mean([s[3] for s in rows])), 4),
+            "fit_seconds": round(float(np.mean([s[1] for s in rows])), 4),
+            "total_fit_seconds": round(float(np.sum([s[1] for s in rows])), 4),
+        })
+    return trials
+
+
+def search(X, y, engines, mode="grid", budget=None, patience=None, folds=None, n_jobs=None, n_iter=None):
+    """
+    Hyperparameter search over ``engines`` on ``(X, y)``.
+
+    ``X`` and ``y`` are dumped once to a temporary directory and handed to the
+    workers as read-only memory maps, so every process in the pool shares one
+    copy of the preprocessed data instead of unpickling its own.
+
+    ``grid`` and ``random`` evaluate candidates in rounds of about two per
+    worker; the search stops early once ``patience`` rounds
+    (``TRAINING_SEARCH_PATIENCE``) pass without a better validation MAE.
+    ``halving`` runs successive halving: all candidates on a small sample of
+    rows, then the best third on three times as many rows, up to every row.
+    The search never starts a round after ``budget`` seconds
+    (``TRAINING_SEARCH_BUDGET``) have passed; the round in flight finishes.
+
+    Returns a summary dict: ``best`` (an entry of ``trials``, like a
+    ``cross_validate`` result), ``trials`` sorted best first, the number of
+    ``candidates`` and ``rounds``, why it ``stopped`` and ``seconds`` elapsed.
+    """
+    budget = budget if budget is not None else _setting("TRAINING_SEARCH_BUDGET", 300)
+    patience = patience if patience is not None else _setting("TRAINING_SEARCH_PATIENCE", 3)
+    n_jobs = n_jobs if n_jobs is not None else _setting("TRAINING_CV_JOBS", -1)
+    y = np.asarray(y, dtype=np.float64)
+    folds = min(folds or _setting("TRAINING_CV_FOLDS", 5), len(y))
+    if folds < 2:
+        raise ValueError("At least two labelled rows are needed to validate a model.")
+
+    pool = candidates(engines, mode, n_iter)
+    rows = np.random.RandomState(0).permutation(len(y))
+    start = time.perf_counter()
+    trials, rounds, stopped = [], 0, "exhausted"
+
+    with tempfile.TemporaryDirectory(prefix="edupredict-search-") as tmp:
+        joblib.dump(np.ascontiguousarray(X, dtype=np.float64), os.path.join(tmp, "X.npy"))
+        joblib.dump(y, os.path.join(tmp, "y.npy"))
+        X = joblib.load(os.path.join(tmp, "X.npy"), mmap_mode="r")
+        y = joblib.load(os.path.join(tmp, "y.npy"), mmap_mode="r")
+
+        # one pool for the whole search; memmapped inputs travel as file references
+        with Parallel(n_jobs=n_jobs) as parallel:
+            if mode == "halving":
+                factor = 3
+                steps = max(math.ceil(math.log(len(pool), factor)), 1)
+                survivors = pool
+                for step in range(steps + 1):
+                    n_rows = max(len(y) // factor ** (steps - step), min(len(y), 20 * folds))
+                    if time.perf_counter() - start > budget:
+                        stopped = "budget"
+                        break
+                    results = _evaluate(parallel, X, y, survivors, _splits(rows, folds, n_rows))
+                    for t in results:
+                        t["rows"] = n_rows
+                    trials = results + trials
+                    rounds += 1
+                    if len(survivors) == 1 or n_rows == len(y):
+                        break
+                    ranked = sorted(range(len(results)), key=lambda i: results[i]["cv_mae"])
+                    survivors = [survivors[i] for i in ranked[:math.ceil(len(survivors) / factor)]]
+                # the best of the largest sample evaluated wins
+                final = [t for t in trials if t["rows"] == max(t["rows"] for t in trials)] if trials else []
+            else:
+                batch = 2 * effective_n_jobs(n_jobs)
+                splits = _splits(rows, folds, len(y))
+                best, stale = None, 0
+                for offset in range(0, len(pool), batch):
+                    if time.perf_counter() - start > budget:
+                        stopped = "budget"
+                        break
+                    results = _evaluate(parallel, X, y, pool[offset:offset + batch], splits)
+                    for t in results:
+                        t["rows"] = len(y)
+                    trials.extend(results)
+                    rounds += 1
+                    round_best = min(t["cv_mae"] for t in results)
+                    if best is None or round_best < best:
+                        best, stale = round_best, 0
+                    else:
+                        stale += 1
+                        if patience and stale >= patience:
+                            stopped = "early_stop"
+                            break
+                final = trials
+
+    if not final:
+        raise ValueError("The search budget ran out before any candidate was evaluated.")
+    trials.sort(key=lambda t: (-t["rows"], t["cv_mae"]))
+    return {
+        "mode": mode,
+        "best": min(final, key=lambda t: t["cv_mae"]),
+        "trials": trials,
+        "candidates": len(pool),
+        "evaluated": len(trials),
+        "rounds": rounds,
+        "stopped": stopped,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def best_per_engine(summary):
+    """The best full-data trial of each engine, best first (the shape ``cross_validate`` returns)."""
+    best = {}
+    for t in summary["trials"]:
+        if t["rows"] == summary["best"]["rows"] and t["engine"] not in best:
+            best[t["engine"]] = t
+    return sorted(best.values(), key=lambda t: t["cv_mae"])
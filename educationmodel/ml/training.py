@@ -0,0 +1,212 @@
+import json
+import time
+
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, r2_score
+
+from educationmodel.ml import engines as model_engines
+from educationmodel.ml import incremental as incremental_fit
+from educationmodel.ml import pipeline
+from educationmodel.ml import search as model_search
+from educationmodel.ml.datastore import datasets
+from educationmodel.ml.profile import get_profile, numeric_view, to_html
+from educationmodel.ml.modelstore import models
+from educationmodel.ml.scoring import encode_frame
+
+
+class StageTimer:
+    """Collects wall-clock time per named stage and forwards progress to ``report``."""
+
+    def __init__(self, stages, report=None):
+        self.stages = list(stages)
+        self.report = report
+        self.timings = {}
+
+    def run(self, name, fn, *args):
+        if self.report:
+            self.report(name, int(100 * self.stages.index(name) / len(self.stages)), self.timings)
+        start = time.perf_counter()
+        result = fn(*args)
+        self.timings[name] = round(time.perf_counter() - start, 4)
+        return result
+
+
+STAGES = ["load", "preprocess", "validate", "fit", "save", "summarize"]
+
+
+def _preprocess(df, features):
+    numeric, categorical = pipeline.split_features(df, features)
+    preprocessor = pipeline.build_preprocessor(numeric, categorical)
+    X = preprocessor.fit_transform(pipeline.prepare_frame(df, numeric, categorical))
+    return preprocessor, numeric, categorical, X
+
+
+def _fit(engine, params, X, y):
+    model = model_engines.make(engine, params)
+    model.fit(X, y)
+    return model
+
+
+def _summarize(dataset_id, df, X, y, features, target):
+    # correlations and column summaries are cached per dataset content
+    profile = get_profile(dataset_id, df)
+    target_corr = {k: v for k, v in profile["correlation"].get(target, {}).items() if v is not None}
+    return {
+        "rows": profile["rows"],
+        "cols": profile["cols"],
+        "features": features,
+        "target": target,
+        "sample_X": to_html(X.head(10), index=False),
+        "sample_y": to_html(y.head(10).to_frame(), index=False),
+        "correlations": profile["correlations_html"],
+        "column_summary": profile["summary_html"],
+        "y_values": json.dumps(y.head(20).tolist()),
+        "corr_values": json.dumps(target_corr),
+        "model_saved": True
+    }
+
+
+def train(dataset_id, features, target, report=None, engines=None, incremental=False, search=None,
+          search_budget=None):
+    """
+    Train a model on a stored dataset and publish it as the active model version.
+
+    Every engine in ``engines`` (default: all of ``engines.ENGINES``) is k-fold
+    cross-validated in parallel; the one with the lowest validation MAE is
+    refit on all rows and published. ``search`` (``"grid"``, ``"random"`` or
+    ``"halving"``) tunes each engine's hyperparameters instead, within
+    ``search_budget`` seconds, see ``search.search``; the winning
+    configuration is refit and saved in the bundle. With ``incremental`` the
+    dataset is taken
+    as new rows for the active (linear or ridge) model instead, see
+    ``_train_incremental``.
+
+    ``report(stage, percent, timings)`` is called before each stage. Returns the
+    ``df_info`` dict rendered by process_result.html, including ``timings``.
+    """
+    engines = [e for e in engines or model_engines.DEFAULT_ENGINES if e in model_engines.ENGINES] or \
+        model_engines.DEFAULT_ENGINES
+    timer = StageTimer(STAGES, report)
+
+    df = timer.run("load", datasets.open, dataset_id)
+    if df is None:
+        raise LookupError("The uploaded dataset is no longer available. Please upload it again.")
+
+    # rows without a target value cannot be learned from
+    y = numeric_view(df[[target]])[target]
+    labelled = y.notna().to_numpy()
+    train_df = df if labelled.all() else df[labelled]
+    y = y[labelled]
+
+    if incremental:
+        return _train_incremental(timer, dataset_id, df, train_df, y, features, target)
+
+    preprocessor, numeric, categorical, Xt = timer.run("preprocess", _preprocess, train_df, features)
+    y_values = y.to_numpy(dtype=float)
+    if search:
+        summary = timer.run("validate", model_search.search, Xt, y_values, engines, search, search_budget)
+        results, cv_seconds, best = model_search.best_per_engine(summary), summary["seconds"], summary["best"]
+    else:
+        summary = None
+        results, cv_seconds = timer.run("validate", model_engines.cross_validate, Xt, y_values, engines)
+        best = results[0]
+    model = timer.run("fit", _fit, best["engine"], best["params"], Xt, y_values)
+
+    metrics = {"r2": best["cv_r2"], "mae": best["cv_mae"], "engine": best["engine"]}
+
+    bundle = {
+        "model": model,
+        "preprocessor": preprocessor,
+        "numeric_features": numeric,
+        "categorical_features": categorical,
+        "encoders": pipeline.lookup_tables(preprocessor, numeric, categorical),
+        "features": features,
+        "target": target,
+        "engine": best["engine"],
+        "params": best["params"],
+    }
+    if summary:
+        # the winning configuration and how it was found, without the full trial list
+        bundle["search"] = {k: v for k, v in summary.items() if k != "trials"}
+    if best["engine"] in incremental_fit.INCREMENTAL_ENGINES:
+        # lets later uploads extend this model without revisiting these rows
+        bundle["stats"] = incremental_fit.initial_stats(preprocessor, train_df, y_values, numeric, categorical)
+
+    version = timer.run("save", models.publish, bundle, {
+        "features": features,
+        "target": target,
+        "rows": int(len(y)),
+        "dataset_id": dataset_id,
+        "metrics": metrics,
+        "engines": results,
+        **({"search": bundle["search"]} if summary else {}),
+    })
+
+    X = pd.DataFrame(Xt[:10], columns=numeric + categorical)[features]
+    df_info = timer.run("summarize", _summarize, dataset_id, df, X, y, features, target)
+    df_info["timings"] = timer.timings
+    df_info["version"] = version
+    df_info["metrics"] = metrics
+    df_info["engines"] = results
+    df_info["cv_seconds"] = cv_seconds
+    if summary:
+        df_info["search"] = {**summary, "label": model_search.SEARCH_MODES[search], "trials": summary["trials"][:15]}
+    return df_info
+
+
+def _train_incremental(timer, dataset_id, df, train_df, y, features, target):
+    """
+    Extend the active model with the rows of ``dataset_id``.
+
+    The bundle's sufficient statistics (ZᵀZ, Zᵀy, column sums, ranges and
+    category counts) absorb the new rows, and the model is re-solved from them,
+    so the cost depends on the new rows only. The result equals a full refit on
+    old + new rows, except that missing values in the new rows are imputed with
+    the means known before the update. Reported metrics are those of the
+    previous model on the new rows, which it has not seen.
+    """
+    base_version = (models.pointer() or {}).get("active")
+    base = models.load(base_version) if base_version else None
+    if base is None or "stats" not in base:
+        raise ValueError("The active model cannot be updated incrementally; run a full training first.")
+    if base["features"] != features or base["target"] != target:
+        raise ValueError("Incremental training must use the same features and target as the active model.")
+
+    numeric, categorical = base["numeric_features"], base["categorical_features"]
+    y_values = y.to_numpy(dtype=float)
+    predicted = base["model"].predict(encode_frame(base, train_df))
+    metrics = {
+        "r2": round(float(r2_score(y_values, predicted)), 4) if len(y_values) > 1 else None,
+        "mae": round(float(mean_absolute_error(y_values, predicted)), 4),
+        "engine": base["engine"],
+        "mode": "incremental",
+    }
+
+    stats = timer.run("preprocess", incremental_fit.update, base, train_df, y_values)
+    preprocessor = incremental_fit.refresh_preprocessor(base["preprocessor"], stats, numeric, categorical)
+    model = timer.run("fit", incremental_fit.solve, base["engine"], base["params"], stats, preprocessor,
+                      numeric, categorical)
+
+    bundle = {
+        **{k: v for k, v in base.items() if k != "version"},
+        "model": model,
+        "preprocessor": preprocessor,
+        "encoders": pipeline.lookup_tables(preprocessor, numeric, categorical),
+        "stats": stats,
+    }
+    version = timer.run("save", models.publish, bundle, {
+        "features": features,
+        "target": target,
+        "rows": int(stats["n"]),
+        "dataset_id": dataset_id,
+        "metrics": metrics,
+        "base_version": base_version,
+    })
+
+    X = pd.DataFrame(pipeline.transform(bundle, train_df.head(10)), columns=numeric + categorical)[features]
+    df_info = timer.run("summarize", _summarize, dataset_id, df, X, y, features, target)
+    df_info["timings"] = timer.timings
+    df_info["version"] = version
+    df_info["metrics"] = metrics
+    df_info["incremental"] = {"base_version": base_version, "new_rows": int(len(y)), "total_rows": int(stats["n"])}
+    return df_info
@@ -0,0 +1,61 @@
+import hashlib
+import os
+import threading
+
+from django.conf import settings
+
+from educationmodel.ml.datastore import datasets
+from educationmodel.ml.ingest import ingest
+from educationmodel.models import DatasetUpload
+
+
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx", ".xls")
+
+
+def _root():
+    return str(getattr(settings, "UPLOAD_ROOT", "uploads"))
+
+
+def store(uploaded_file):
+    """
+    Save an upload under its SHA-256, hashing it while it streams to disk.
+    Identical content is kept once. Returns ``(sha256, path)``.
+    """
+    ext = os.path.splitext(uploaded_file.name)[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise ValueError("Only CSV and Excel files are supported.")
+
+    os.makedirs(_root(), exist_ok=True)
+    tmp_path = os.path.join(_root(), f".incoming.{os.getpid()}.{threading.get_ident()}{ext}")
+    digest = hashlib.sha256()
+    with open(tmp_path, "wb") as f:
+        for chunk in uploaded_file.chunks():
+            digest.update(chunk)
+            f.write(chunk)
+
+    sha = digest.hexdigest()
+    path = os.path.join(_root(), sha[:2], sha + ext)
+    if os.path.exists(path):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+    return sha, path
+
+
+def dataset_for_upload(uploaded_file):
+    """
+    Return the dataset ID for an upload, parsing it only if this exact content
+    has not been ingested before (or its dataset has since been evicted).
+    """
+    sha, path = store(uploaded_file)
+    record, _ = DatasetUpload.objects.get_or_create(
+        sha256=sha, defaults={"original_name": uploaded_file.name, "size": uploaded_file.size})
+
+    if record.dataset_id and datasets.meta(record.dataset_id) is not None:
+        datasets.touch(record.dataset_id)
+        return record.dataset_id
+
+    record.dataset_id = ingest(path)
+    record.save(update_fields=["dataset_id"])
+    return record.dataset_id
@@ -1,10 +1,11 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 # Create your models here.
 class Signup(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField(unique=True)
-    password = models.CharField(max_length=100)
+    password = models.CharField(max_length=128)  # Django password hash, see educationmodel.hashers
     usertype = models.CharField(max_length=20, choices=[("admin","Admin"),("teacher","Teacher"),("student","Student")])
     
     # Student-specific
@@ -15,6 +16,17 @@ class Signup(models.Model):
     subject = models.CharField(max_length=100, null=True, blank=True)
     department = models.CharField(max_length=100, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # roster listings: WHERE usertype = ... ORDER BY id, paged by id
+            models.Index(fields=["usertype", "id"], name="signup_usertype_id_idx"),
+            # case-insensitive prefix search
+            models.Index(Upper("name"), name="signup_name_upper_idx"),
+            models.Index(Upper("email"), name="signup_email_upper_idx"),
+            models.Index(Upper("class_name"), name="signup_class_upper_idx"),
+            models.Index(Upper("roll_no"), name="signup_roll_upper_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -25,3 +37,81 @@ class Feedback(models.Model) :
     subject = models.CharField(max_length=100)
     message = models.CharField(max_length=100)
     fkuser = models.ForeignKey(Signup,on_delete=models.CASCADE)
+
+
+class TrainingJob(models.Model):
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    dataset_id = models.CharField(max_length=64)
+    features = models.JSONField(default=list)
+    target = models.CharField(max_length=100)
+    options = models.JSONField(default=dict)  # extra keyword arguments for ml.training.train
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued", db_index=True)
+    stage = models.CharField(max_length=30, blank=True)
+    progress = models.PositiveSmallIntegerField(default=0)
+    timings = models.JSONField(default=dict)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)  # refreshed while a worker runs the job
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Training job {self.id} ({self.status})"
+
+
+class DatasetUpload(models.Model):
+    sha256 = models.CharField(max_length=64, unique=True)
+    original_name = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    dataset_id = models.CharField(max_length=64, blank=True)
+    uploaded_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.original_name} ({self.sha256[:12]})"
+
+
+class DashboardCounter(models.Model):
+    """
+    Pre-aggregated dashboard numbers, kept current by signals instead of COUNT(*)
+    per page view. Keys look like ``role:student``, ``class:10-A`` or
+    ``predictions:2025-10-03``.
+    """
+    key = models.CharField(max_length=150, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
+
+
+class Prediction(models.Model):
+    """
+    One scored student submission. Rows are buffered in each web worker and
+    bulk-inserted by ``educationmodel.prediction_log``, so ``created_at`` is the
+    time of scoring, not of the insert.
+    """
+    # the (student, created_at) index below also serves plain student lookups
+    student = models.ForeignKey(Signup, on_delete=models.CASCADE, null=True, blank=True,
+                                related_name="predictions", db_index=False)
+    inputs = models.JSONField(default=dict)
+    score = models.FloatField()
+    contributions = models.JSONField(default=dict)  # {feature: share of score}, see ml.explain
+    model_version = models.CharField(max_length=64)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            # a student's history, newest first; class reports join students to this
+            models.Index(fields=["student", "-created_at"], name="prediction_student_idx"),
+            # everything scored by one model version
+            models.Index(fields=["model_version", "-created_at"], name="prediction_version_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.score:.2f} ({self.model_version})"
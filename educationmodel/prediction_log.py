@@ -0,0 +1,117 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, close_old_connections
+from django.utils import timezone
+
+from educationmodel.models import Prediction, Signup
+from educationmodel.stats import bump, prediction_key
+
+
+logger = logging.getLogger(__name__)
+
+_buffer = []
+_counts = Counter()  # daily prediction counter deltas not yet written
+_lock = threading.Lock()
+_wake = threading.Event()
+_flusher = None
+
+
+def _flush_rows():
+    return getattr(settings, "PREDICTION_FLUSH_ROWS", 200)
+
+
+def _flush_seconds():
+    return getattr(settings, "PREDICTION_FLUSH_SECONDS", 2.0)
+
+
+def record(student_id, inputs, score, model_version, contributions=None):
+    """
+    Queue one prediction for insertion and return immediately. A background
+    thread bulk-inserts the queue every ``PREDICTION_FLUSH_SECONDS``, or sooner
+    once ``PREDICTION_FLUSH_ROWS`` are waiting, and adds it to the day's
+    prediction counter in the same pass.
+    """
+    row = Prediction(student_id=student_id, inputs=inputs, score=score, contributions=contributions or {},
+                     model_version=model_version or "", created_at=timezone.now())
+    with _lock:
+        _buffer.append(row)
+        _counts[prediction_key()] += 1
+        full = len(_buffer) >= _flush_rows()
+        _start_flusher()
+    if full:
+        _wake.set()
+
+
+def count(n=1):
+    """Queue ``n`` predictions that are not stored (no student) for the day's counter."""
+    with _lock:
+        _counts[prediction_key()] += n
+        _start_flusher()
+
+
+def flush():
+    """Insert everything queued so far in this process. Returns the row count."""
+    with _lock:
+        rows = _buffer[:]
+        del _buffer[:]
+        counts = dict(_counts)
+        _counts.clear()
+    try:
+        bump(counts)
+    except DatabaseError:
+        logger.exception("Dropped prediction counts %s", counts)
+    if not rows:
+        return 0
+    try:
+        Prediction.objects.bulk_create(rows, batch_size=500)
+    except IntegrityError:
+        # a student deleted since scoring fails the whole batch: keep everyone else's rows
+        return _insert_existing(rows)
+    except DatabaseError:
+        logger.exception("Dropped %d prediction rows", len(rows))
+        return 0
+    return len(rows)
+
+
+def _insert_existing(rows):
+    try:
+        existing = set(Signup.objects.filter(
+            id__in={row.student_id for row in rows if row.student_id is not None}
+        ).values_list("id", flat=True))
+        kept = [row for row in rows if row.student_id is None or row.student_id in existing]
+        if len(kept) < len(rows):
+            logger.warning("Dropped %d prediction rows of deleted students", len(rows) - len(kept))
+        Prediction.objects.bulk_create(kept, batch_size=500)
+    except DatabaseError:
+        logger.exception("Dropped %d prediction rows", len(rows))
+        return 0
+    return len(kept)
+
+
+def pending(student_id):
+    """The newest queued (not yet inserted) prediction of ``student_id``, if any."""
+    with _lock:
+        for row in reversed(_buffer):
+            if row.student_id == student_id:
+                return row
+    return None
+
+
+def _run():
+    while True:
+        _wake.wait(_flush_seconds())
+        _wake.clear()
+        close_old_connections()
+        flush()
+
+
+def _start_flusher():
+    global _flusher
+    if _flusher is None:
+        _flusher = threading.Thread(target=_run, name="prediction-log", daemon=True)
+        _flusher.start()
+        atexit.register(flush)
@@ -0,0 +1,86 @@
+import csv
+import io
+
+from educationmodel.ml.modelstore import models
+from educationmodel.models import Prediction
+
+
+ITERATOR_CHUNK = 2000
+CSV_BATCH_ROWS = 1000
+STUDENT_COLUMNS = ["Student Name", "Email", "Class", "Roll No"]
+
+
+def prediction_report(class_name=None, version=None, history=False):
+    """
+    ``(header, rows)`` for a class- or school-wide prediction report.
+
+    ``rows`` is a lazy generator over a chunked (server-side on PostgreSQL)
+    cursor ordered along the (student, -created_at) index, so only one chunk
+    is ever held in memory. Unless ``history`` is set only each student's
+    newest prediction is kept. Feature columns are the union of the features of
+    the model versions involved, read from their metadata up front so the header
+    can be sent before the first row is fetched.
+    """
+    queryset = Prediction.objects.filter(student__isnull=False)
+    if class_name:
+        queryset = queryset.filter(student__class_name=class_name)
+    if version:
+        queryset = queryset.filter(model_version=version)
+
+    features = []
+    for v in queryset.order_by().values_list("model_version", flat=True).distinct():
+        for f in (models.meta(v) or {}).get("features", []):
+            if f not in features:
+                features.append(f)
+    header = STUDENT_COLUMNS + features + ["Predicted Score", "Model Version", "Predicted At"]
+
+    def rows():
+        last_student = None
+        for student_id, name, email, klass, roll_no, inputs, score, model_version, created_at in (
+            queryset.order_by("student_id", "-created_at").values_list(
+                "student_id", "student__name", "student__email", "student__class_name", "student__roll_no",
+                "inputs", "score", "model_version", "created_at",
+            ).iterator(chunk_size=ITERATOR_CHUNK)
+        ):
+            if not history and student_id == last_student:
+                continue
+            last_student = student_id
+            yield [name, email, klass or "", roll_no or ""] + \
+                [inputs.get(f, "") for f in features] + \
+                [round(score, 2), model_version, created_at.isoformat(timespec="seconds")]
+
+    return header, rows()
+
+
+def iter_csv(header, rows, batch=CSV_BATCH_ROWS):
+    """Yield CSV text: the header on its own, then ``batch`` rows per chunk."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    yield buf.getvalue()
+
+    buf.seek(0)
+    buf.truncate()
+    n = 0
+    for row in rows:
+        writer.writerow(row)
+        n += 1
+        if n == batch:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            n = 0
+    if n:
+        yield buf.getvalue()
+
+
+def write_xlsx(header, rows, fh):
+    """Write the report to ``fh`` with openpyxl's write-only (streaming) workbook."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Predictions")
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    wb.save(fh)
@@ -0,0 +1,104 @@
+from collections import Counter
+
+import pandas as pd
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from educationmodel import stats
+from educationmodel.models import Signup
+
+
+IMPORT_BATCH_SIZE = 1000
+LOOKUP_BATCH_SIZE = 900  # stays under SQLite's bound-parameter limit
+
+ROLE_FIELDS = {
+    "student": ["class_name", "roll_no"],
+    "teacher": ["subject", "department"],
+}
+
+
+def read_roster(source, name):
+    """Read a CSV/Excel roster (path or file object) with every cell as text, so roll numbers stay ``007``."""
+    if name.lower().endswith(".csv"):
+        df = pd.read_csv(source, dtype=str, keep_default_na=False)
+    elif name.lower().endswith((".xlsx", ".xls")):
+        df = pd.read_excel(source, dtype=str, keep_default_na=False)
+    else:
+        raise ValueError("Only CSV and Excel files are supported.")
+    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    return df
+
+
+def _existing_emails(emails):
+    """Emails already registered, found with a handful of IN queries rather than one per row."""
+    existing = set()
+    emails = list(emails)
+    for start in range(0, len(emails), LOOKUP_BATCH_SIZE):
+        existing.update(Signup.objects.filter(email__in=emails[start:start + LOOKUP_BATCH_SIZE])
+                        .values_list("email", flat=True))
+    return existing
+
+
+def import_roster(df, usertype):
+    """
+    Validate and insert roster rows as ``usertype`` Signups.
+
+    Rows are checked in memory, duplicate emails are resolved against the file
+    and the database with set lookups, and valid rows are written with
+    ``bulk_create`` in batches inside one transaction. Accounts are created
+    with unusable passwords, so nothing is hashed here; each user chooses a
+    password through the set-password link an admin downloads afterwards. Returns
+    ``(created_count, errors)`` where errors are ``(row_number, message)``;
+    row numbers match the spreadsheet (header is row 1).
+    """
+    fields = ROLE_FIELDS[usertype]
+    missing = [c for c in ("name", "email") if c not in df.columns]
+    if missing:
+        raise ValueError("Missing required column(s): " + ", ".join(missing))
+
+    records = df.reindex(columns=["name", "email"] + fields, fill_value="")
+    records = records.apply(lambda col: col.str.strip())
+    existing = _existing_emails(set(records["email"].str.lower()) | set(records["email"]))
+
+    errors = []
+    seen = set()
+    rows = []
+    for row_number, row in enumerate(records.itertuples(index=False), start=2):
+        email = row.email
+        if not row.name:
+            errors.append((row_number, "Name is required."))
+            continue
+        try:
+            validate_email(email)
+        except ValidationError:
+            errors.append((row_number, f"Invalid email '{email}'."))
+            continue
+        key = email.lower()
+        if key in seen:
+            errors.append((row_number, f"Email '{email}' appears more than once in the file."))
+            continue
+        if email in existing or key in existing:
+            errors.append((row_number, f"Email '{email}' is already registered."))
+            continue
+        seen.add(key)
+        rows.append(Signup(
+            name=row.name, email=email, password=make_password(None), usertype=usertype,
+            **{f: getattr(row, f) or None for f in fields},
+        ))
+
+    with transaction.atomic():
+        Signup.objects.bulk_create(rows, batch_size=IMPORT_BATCH_SIZE)
+        # bulk_create skips the save signals that maintain the dashboard counters
+        deltas = Counter()
+        for signup in rows:
+            deltas.update(stats.signup_keys(signup.usertype, signup.class_name))
+        stats.bump(deltas)
+
+    return len(rows), errors
+
+
+def awaiting_password(usertype):
+    """``usertype`` accounts whose owner has not set a password yet (imported ones)."""
+    return Signup.objects.filter(usertype=usertype, password__startswith=UNUSABLE_PASSWORD_PREFIX)
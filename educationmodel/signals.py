@@ -0,0 +1,29 @@
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from educationmodel import stats
+from educationmodel.models import Signup
+
+
+@receiver(pre_save, sender=Signup)
+def remember_counted_fields(sender, instance, **kwargs):
+    # edits can move a student between classes or roles; remember what was counted
+    instance._counted_keys = []
+    if instance.pk:
+        old = Signup.objects.filter(pk=instance.pk).values_list("usertype", "class_name").first()
+        if old:
+            instance._counted_keys = stats.signup_keys(*old)
+
+
+@receiver(post_save, sender=Signup)
+def count_signup(sender, instance, **kwargs):
+    deltas = Counter(stats.signup_keys(instance.usertype, instance.class_name))
+    deltas.subtract(getattr(instance, "_counted_keys", []))
+    stats.bump(deltas)
+
+
+@receiver(post_delete, sender=Signup)
+def uncount_signup(sender, instance, **kwargs):
+    stats.bump({key: -1 for key in stats.signup_keys(instance.usertype, instance.class_name)})
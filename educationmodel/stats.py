@@ -0,0 +1,71 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from educationmodel.models import DashboardCounter, Signup
+
+
+def prediction_key():
+    """Counter key of today's predictions."""
+    return "predictions:" + timezone.localdate().isoformat()
+
+
+def signup_keys(usertype, class_name):
+    """Counter keys a single Signup row contributes to."""
+    keys = []
+    if usertype:
+        keys.append("role:" + usertype.lower())
+        if usertype.lower() == "student" and class_name:
+            keys.append("class:" + class_name)
+    return keys
+
+
+def bump(deltas):
+    """Apply ``{key: delta}`` increments with one UPDATE per key (creating missing keys)."""
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        if DashboardCounter.objects.filter(key=key).update(value=F("value") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                DashboardCounter.objects.create(key=key, value=delta)
+        except IntegrityError:
+            # another request created it first
+            DashboardCounter.objects.filter(key=key).update(value=F("value") + delta)
+
+
+def record_predictions(count=1):
+    bump({prediction_key(): count})
+
+
+def dashboard_stats():
+    """Every dashboard counter from a single indexed query."""
+    today = prediction_key()
+    rows = DashboardCounter.objects.filter(
+        Q(key__startswith="role:") | Q(key__startswith="class:") | Q(key=today)
+    ).values_list("key", "value")
+
+    stats = {"total_students": 0, "total_teachers": 0, "total_admins": 0,
+             "students_per_class": {}, "predictions_today": 0}
+    for key, value in rows:
+        if key == today:
+            stats["predictions_today"] = value
+        elif key.startswith("role:"):
+            stats[f"total_{key[5:]}s"] = value
+        elif value:
+            stats["students_per_class"][key[6:]] = value
+    stats["students_per_class"] = dict(sorted(stats["students_per_class"].items()))
+    return stats
+
+
+def rebuild():
+    """Recount role/class counters from the Signup table (prediction counters are kept)."""
+    counts = Counter()
+    for usertype, class_name in Signup.objects.values_list("usertype", "class_name").iterator():
+        counts.update(signup_keys(usertype, class_name))
+    with transaction.atomic():
+        DashboardCounter.objects.filter(Q(key__startswith="role:") | Q(key__startswith="class:")).delete()
+        DashboardCounter.objects.bulk_create([DashboardCounter(key=k, value=v) for k, v in counts.items()])
@@ -1,3 +1,115 @@
-from django.test import TestCase
+import io
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from educationmodel.ml import compact, explain, incremental, pipeline
+from educationmodel.ml import engines as model_engines
+
+
+def _students(n, seed):
+    rng = np.random.RandomState(seed)
+    df = pd.DataFrame({
+        "Hours_Studied": rng.randint(1, 40, n).astype(float),
+        "Attendance": rng.uniform(60, 100, n),
+        "Motivation_Level": rng.choice(["Low", "Medium", "High"], n),
+        "School_Type": rng.choice(["Public", "Private"], n),
+    })
+    y = (0.3 * df["Hours_Studied"] + 0.2 * df["Attendance"]
+         + df["Motivation_Level"].map({"Low": 0, "Medium": 1, "High": 2}) + rng.normal(0, 1, n))
+    return df, y.to_numpy()
+
+
+def _fit(df, y, features, engine):
+    """A full training run's bundle (without the model store)."""
+    numeric, categorical = pipeline.split_features(df, features)
+    preprocessor = pipeline.build_preprocessor(numeric, categorical)
+    X = preprocessor.fit_transform(pipeline.prepare_frame(df, numeric, categorical))
+    model = model_engines.make(engine).fit(X, y)
+    return {
+        "model": model,
+        "preprocessor": preprocessor,
+        "numeric_features": numeric,
+        "categorical_features": categorical,
+        "encoders": pipeline.lookup_tables(preprocessor, numeric, categorical),
+        "features": features,
+        "engine": engine,
+        "params": model_engines.ENGINES[engine][2],
+        "stats": incremental.initial_stats(preprocessor, df, y, numeric, categorical),
+    }
+
+
+FEATURES = ["Hours_Studied", "Attendance", "Motivation_Level", "School_Type"]
+
+
+class IncrementalTrainingTests(SimpleTestCase):
+    def test_matches_full_refit(self):
+        old, y_old = _students(400, 0)
+        new, y_new = _students(150, 1)
+        both, y_both = pd.concat([old, new], ignore_index=True), np.concatenate([y_old, y_new])
+
+        for engine in incremental.INCREMENTAL_ENGINES:
+            with self.subTest(engine=engine):
+                base = _fit(old, y_old, FEATURES, engine)
+                numeric, categorical = base["numeric_features"], base["categorical_features"]
+                stats = incremental.update(base, new, y_new)
+                preprocessor = incremental.refresh_preprocessor(base["preprocessor"], stats, numeric, categorical)
+                model = incremental.solve(engine, base["params"], stats, preprocessor, numeric, categorical)
+
+                full = _fit(both, y_both, FEATURES, engine)
+                X = full["preprocessor"].transform(pipeline.prepare_frame(both, numeric, categorical))
+                self.assertEqual(stats["n"], len(y_both))
+                np.testing.assert_allclose(model.predict(X), full["model"].predict(X), rtol=0, atol=1e-9)
+
+    def test_unseen_category_needs_full_training(self):
+        old, y_old = _students(200, 0)
+        new, y_new = _students(10, 1)
+        new.loc[0, "School_Type"] = "Charter"
+        with self.assertRaises(ValueError):
+            incremental.update(_fit(old, y_old, FEATURES, "linear"), new, y_new)
+
+
+class CompactModelTests(SimpleTestCase):
+    def test_predicts_like_the_full_bundle(self):
+        df, y = _students(300, 0)
+        rows, _ = _students(50, 2)
+        # gaps take the trained fill values, a category the model has never seen code -1
+        rows.loc[0, "Attendance"] = np.nan
+        rows.loc[1, "Motivation_Level"] = ""
+        rows.loc[2, "School_Type"] = "Charter"
+
+        for engine in incremental.INCREMENTAL_ENGINES:
+            with self.subTest(engine=engine):
+                bundle = _fit(df, y, FEATURES, engine)
+                bundle.update(version="test", target="Exam_Score")
+                artifact = io.BytesIO()
+                compact.export(bundle, artifact)
+                artifact.seek(0)
+                model = compact.CompactModel.load(artifact)
+
+                expected = bundle["model"].predict(pipeline.transform(bundle, rows))
+                np.testing.assert_array_equal(model.predict(rows.to_dict("records")), expected)
+
+    def test_served_bundle_explains_like_the_full_bundle(self):
+        df, y = _students(300, 0)
+        rows, _ = _students(20, 3)
+        bundle = _fit(df, y, FEATURES, "ridge")
+        bundle.update(version="test", target="Exam_Score")
+        artifact = io.BytesIO()
+        compact.export(bundle, artifact)
+        artifact.seek(0)
+        served = compact.CompactModel.load(artifact).as_bundle()
+
+        records = rows.to_dict("records")
+        X = compact.encode_rows(served, records)
+        np.testing.assert_array_equal(X, pipeline.transform(bundle, rows))
+        self.assertEqual(explain.explain_rows(served, X), explain.explain_rows(bundle, X))
+
+    def test_rejects_tree_models(self):
+        df, y = _students(100, 0)
+        bundle = _fit(df, y, FEATURES, "linear")
+        bundle["model"] = model_engines.make("forest", {"n_estimators": 2})
+        self.assertFalse(compact.supports(bundle))
+        with self.assertRaises(ValueError):
+            compact.export(bundle, io.BytesIO())